@@ -0,0 +1,384 @@
+"""
+DevDash Textual application.
+"""
+
+import sys
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from textual.app import App, ComposeResult
+from textual.widgets import Footer, Static
+from textual.containers import Container, Horizontal
+from textual.binding import Binding
+
+from devdash.git_panel import GitPanel
+from devdash.system_panel import SystemPanel
+from devdash.tasks_panel import TasksPanel
+from devdash.timer_panel import TimerPanel
+from devdash.help_modal import HelpModal
+from devdash.config_editor_modal import ConfigEditorModal
+from devdash.config import (
+    load_config,
+    DevDashConfig,
+    ConfigLoadError,
+    ConfigLoader,
+    ConfigValidator,
+    get_default_config,
+    KeybindingsConfig,
+)
+
+
+def _normalize_keybinding(value: str) -> str:
+    """Normalize user-provided keybinding strings for Textual.
+
+    We lower-case multi-character bindings (e.g. Ctrl+A -> ctrl+a) while leaving
+    single characters untouched so Shift-style bindings (like `F`) keep meaning.
+    """
+
+    parts = [part.strip() for part in value.strip().split(",") if part.strip()]
+    normalized_parts = []
+    for part in parts:
+        if len(part) == 1:
+            normalized_parts.append(part)
+            continue
+        normalized = part.lower()
+        normalized = re.sub(r"(ctrl|shift|alt|meta|option|cmd|super)-", r"\1+", normalized)
+        normalized_parts.append(normalized)
+    return ",".join(normalized_parts)
+
+
+def _generate_keymap(config: KeybindingsConfig) -> dict[str, str]:
+    """Generate a textual keymap dictionary from keybindings configuration."""
+
+    return {
+        # General actions
+        "quit": _normalize_keybinding(config.quit),
+        "help": _normalize_keybinding(config.help),
+        "config": _normalize_keybinding(config.config),
+        "refresh": _normalize_keybinding(config.refresh),
+        # Task management
+        "add_task": _normalize_keybinding(config.add_task),
+        "edit_task": _normalize_keybinding(config.edit_task),
+        "toggle_task": _normalize_keybinding(config.toggle_task),
+        "delete_task": _normalize_keybinding(config.delete_task),
+        "quick_priority": _normalize_keybinding(config.quick_priority),
+        "filter_tasks": _normalize_keybinding(config.filter_tasks),
+        "sort_tasks": _normalize_keybinding(config.sort_tasks),
+        "export_tasks": _normalize_keybinding(config.export_tasks),
+        "filter_high": _normalize_keybinding(config.filter_high),
+        "filter_medium": _normalize_keybinding(config.filter_medium),
+        "filter_low": _normalize_keybinding(config.filter_low),
+        "clear_filters": _normalize_keybinding(config.clear_filters),
+        # Timer controls
+        "timer_focus": _normalize_keybinding(config.timer_focus),
+        "timer_break": _normalize_keybinding(config.timer_break),
+        "timer_stop": _normalize_keybinding(config.timer_stop),
+    }
+
+
+# Disable mouse tracking modes, then reset the terminal (RIS, as `tput reset`)
+_TERMINAL_RESET = "\033[?1000l\033[?1003l\033[?1015l\033[?1006l\033c"
+
+
+# Layout for the header and the 2x2 panel grid
+_APP_CSS = """
+Screen {
+    align: center middle;
+}
+
+#app-header {
+    background: $boost;
+    color: $text;
+    height: 3;
+    padding: 1;
+    dock: top;
+}
+
+#main-container {
+    width: 100%;
+    height: 100%;
+    padding: 1;
+}
+
+#top-panels {
+    height: 50%;
+    width: 100%;
+}
+
+#bottom-panels {
+    height: 50%;
+    width: 100%;
+}
+
+.panel-half {
+    width: 50%;
+}
+"""
+
+# Default bindings; keys can be remapped via the keymap (see _generate_keymap)
+_APP_BINDINGS = (
+    Binding("q", "quit", "Quit", id="quit"),
+    Binding("?", "help", "Help", id="help"),
+    Binding("c", "config", "Config", id="config"),
+    Binding("r", "refresh", "Refresh", id="refresh"),
+    # Task management
+    Binding("a", "add_task", "Add Task", id="add_task"),
+    Binding("e", "edit_task", "Edit Task", id="edit_task"),
+    Binding("space", "toggle_task", "Toggle Done", id="toggle_task"),
+    Binding("d", "delete_task", "Delete Task", id="delete_task"),
+    Binding("p", "quick_priority", "Set Priority", id="quick_priority"),
+    Binding("f", "filter_tasks", "Filter", id="filter_tasks"),
+    Binding("s", "sort_tasks", "Sort", id="sort_tasks"),
+    Binding("x", "export_tasks", "Export", id="export_tasks"),
+    Binding("1", "filter_high", "High Priority", id="filter_high"),
+    Binding("2", "filter_medium", "Medium Priority", id="filter_medium"),
+    Binding("3", "filter_low", "Low Priority", id="filter_low"),
+    Binding("0", "clear_filters", "Clear Filters", id="clear_filters"),
+    # Timer (use Shift+key to avoid conflicts)
+    Binding("F", "timer_focus", "Focus", id="timer_focus"),
+    Binding("B", "timer_break", "Break", id="timer_break"),
+    Binding("S", "timer_stop", "Stop", id="timer_stop"),
+)
+
+
+class DevDashApp(App):
+    """A terminal dashboard for developers."""
+
+    def __init__(self, config: Optional[DevDashConfig] = None):
+        """Initialize the DevDash application.
+
+        Args:
+            config: Configuration object. If None, loads from default locations.
+        """
+        super().__init__()
+        self.config = config or self._load_config_with_fallback()
+        self._apply_keybindings()
+        # Header pieces: the directory never changes, the clock once a second
+        self._header_prefix = f"[bold]devdash[/] | [cyan]{Path.cwd()}[/] | "
+        self._header_second = -1
+        self._header_text = ""
+        # (path, contents) of the config file at the last reload
+        self._config_stamp: Optional[tuple] = None
+        # Panel widgets, looked up once after compose (see on_mount)
+        self._git_panel: Optional[GitPanel] = None
+        self._system_panel: Optional[SystemPanel] = None
+        self._tasks_panel: Optional[TasksPanel] = None
+        self._timer_panel: Optional[TimerPanel] = None
+
+    def _load_config_with_fallback(self) -> DevDashConfig:
+        """Load configuration with error handling.
+
+        Returns:
+            DevDashConfig: Loaded configuration or defaults if loading fails
+        """
+        try:
+            return load_config()
+        except ConfigLoadError as e:
+            # Log error but continue with defaults
+            print(f"Warning: {e}", file=sys.stderr)
+            print("Using default configuration.", file=sys.stderr)
+            from devdash.config import get_default_config
+            return get_default_config()
+
+    def _apply_keybindings(self) -> None:
+        """Apply the current configuration's keybindings to the app."""
+        if not self.config:
+            return
+        keymap = _generate_keymap(self.config.keybindings)
+        self.set_keymap(keymap)
+
+    CSS = _APP_CSS
+
+    BINDINGS = _APP_BINDINGS
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets for the app."""
+        # Header with current directory and time
+        yield Container(
+            Static(self._get_header_text(), id="header-text"),
+            id="app-header"
+        )
+
+        # Main container with panels
+        with Container(id="main-container"):
+            # Top row: Git (left) and System (right)
+            with Horizontal(id="top-panels"):
+                yield GitPanel(config=self.config.git, classes="panel-half")
+                yield SystemPanel(config=self.config.system, classes="panel-half")
+
+            # Bottom row: Tasks (left) and Timer (right)
+            with Horizontal(id="bottom-panels"):
+                yield TasksPanel(config=self.config.tasks, classes="panel-half")
+                yield TimerPanel(config=self.config.timer, classes="panel-half")
+
+        # Footer with keybindings
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Cache panel references so actions don't query the DOM per keypress."""
+        self._git_panel = self.query_one(GitPanel)
+        self._system_panel = self.query_one(SystemPanel)
+        self._tasks_panel = self.query_one(TasksPanel)
+        self._timer_panel = self.query_one(TimerPanel)
+
+    def _get_header_text(self) -> str:
+        """Generate header text with directory and time.
+
+        The text is cached and only rebuilt when the wall-clock second changes.
+        """
+        second = int(time.time())
+        if second != self._header_second:
+            now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._header_text = f"{self._header_prefix}[dim]{now}[/]"
+            self._header_second = second
+        return self._header_text
+
+    def action_quit(self) -> None:
+        """Quit the application."""
+        self.exit()
+
+    def on_unmount(self) -> None:
+        """Clean up terminal state on exit."""
+        # Reset terminal modes to prevent cursor artifacts. Write to the real
+        # stdout, since Textual captures sys.stdout while the app is running.
+        stdout = sys.__stdout__
+        if stdout is not None and stdout.isatty():
+            stdout.write(_TERMINAL_RESET)
+            stdout.flush()
+
+    def action_help(self) -> None:
+        """Show help popup with configured keybindings."""
+        self.push_screen(HelpModal(self.config))
+
+    def action_config(self) -> None:
+        """Show configuration editor."""
+        loader = ConfigLoader()
+        config_path = loader.find_config_file()
+
+        def handle_config_result(result) -> None:
+            """Handle config editor result."""
+            if result is True:
+                # Reload and apply the new configuration
+                self.reload_config()
+            elif result is False:
+                self.notify("Configuration changes cancelled", severity="information", timeout=1)
+
+        self.push_screen(
+            ConfigEditorModal(self.config, config_path),
+            handle_config_result
+        )
+
+    def reload_config(self) -> None:
+        """Reload configuration from file and apply to all panels."""
+        try:
+            # Skip the reload if the config file hasn't changed since last time.
+            # Compare contents: mtime can miss a same-size save within one tick
+            config_path = ConfigLoader.find_config_file()
+            stamp = None
+            if config_path is not None:
+                stamp = (config_path, config_path.read_bytes())
+                if stamp == self._config_stamp:
+                    self.notify("Configuration unchanged", severity="information", timeout=1)
+                    return
+
+            # Reload config from file
+            new_config = load_config(config_path) if config_path else get_default_config()
+
+            # Validate it
+            warnings = ConfigValidator.validate_config(new_config)
+            if warnings:
+                # Show warnings but continue, as a single toast
+                self.notify(
+                    "Config warnings:\n" + "\n".join(f"• {warning}" for warning in warnings),
+                    severity="warning",
+                    timeout=5,
+                )
+
+            # Update app config
+            self.config = new_config
+            self._apply_keybindings()
+
+            # Update each panel with new config, redrawing the screen once
+            with self.batch_update():
+                self._git_panel.update_config(new_config.git)
+                self._system_panel.update_config(new_config.system)
+                self._tasks_panel.update_config(new_config.tasks)
+                self._timer_panel.update_config(new_config.timer)
+
+            self._config_stamp = stamp
+
+            # Show success notification
+            self.notify("Configuration reloaded successfully", severity="information", timeout=2)
+
+        except Exception as e:
+            # If reload fails, keep using old config
+            self.notify(f"Error reloading config: {e}", severity="error", timeout=5)
+
+    def action_refresh(self) -> None:
+        """Refresh all panels."""
+        # Will implement when panels have refresh methods
+        pass
+
+    # Task panel actions - delegate to TasksPanel
+    def action_add_task(self) -> None:
+        """Add a new task."""
+        self._tasks_panel.action_add_task()
+
+    def action_edit_task(self) -> None:
+        """Edit selected task."""
+        self._tasks_panel.action_edit_task()
+
+    def action_toggle_task(self) -> None:
+        """Toggle task completion."""
+        self._tasks_panel.action_toggle_task()
+
+    def action_delete_task(self) -> None:
+        """Delete selected task."""
+        self._tasks_panel.action_delete_task()
+
+    def action_quick_priority(self) -> None:
+        """Quick set priority."""
+        self._tasks_panel.action_quick_priority()
+
+    def action_filter_tasks(self) -> None:
+        """Toggle task filter."""
+        self._tasks_panel.action_filter_tasks()
+
+    def action_sort_tasks(self) -> None:
+        """Cycle sort order."""
+        self._tasks_panel.action_sort_tasks()
+
+    def action_export_tasks(self) -> None:
+        """Export tasks to Markdown."""
+        self._tasks_panel.action_export_tasks()
+
+    def action_filter_high(self) -> None:
+        """Filter high priority tasks."""
+        self._tasks_panel.action_filter_high()
+
+    def action_filter_medium(self) -> None:
+        """Filter medium priority tasks."""
+        self._tasks_panel.action_filter_medium()
+
+    def action_filter_low(self) -> None:
+        """Filter low priority tasks."""
+        self._tasks_panel.action_filter_low()
+
+    def action_clear_filters(self) -> None:
+        """Clear all task filters."""
+        self._tasks_panel.action_clear_filters()
+
+    # Timer panel actions - delegate to TimerPanel
+    def action_timer_focus(self) -> None:
+        """Start focus session."""
+        self._timer_panel.action_start_focus()
+
+    def action_timer_break(self) -> None:
+        """Start break session."""
+        self._timer_panel.action_start_break()
+
+    def action_timer_stop(self) -> None:
+        """Stop timer."""
+        self._timer_panel.action_stop_timer()
@@ -23,6 +23,7 @@ class GitConfig:
 
     enabled: bool = True
     refresh_interval: int = 5  # seconds
+    max_refresh_interval: int = 60  # seconds, upper bound while the repo is idle
     max_commits: int = 3
     show_staged: bool = True
     show_modified: bool = True
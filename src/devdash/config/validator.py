@@ -54,6 +54,12 @@ class ConfigValidator:
                 f"{config.refresh_interval // 60} minutes)"
             )
 
+        if config.max_refresh_interval < config.refresh_interval:
+            warnings.append(
+                f"git.max_refresh_interval ({config.max_refresh_interval}) is less than "
+                f"git.refresh_interval ({config.refresh_interval}), idle backoff disabled"
+            )
+
         if config.max_commits < 0 or config.max_commits > 20:
             warnings.append(
                 f"git.max_commits should be 0-20 (got {config.max_commits}), "
@@ -2,186 +2,362 @@
 Configuration editor modal - TUI interface for editing DevDash configuration.
 """
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Static, Switch, Select, TabbedContent, TabPane
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
+from textual.widget import Widget
 
 from devdash.config import ConfigLoader, DevDashConfig, ConfigValidator
 
 
+_SORT_OPTIONS = ("created", "priority", "due_date", "text")
+_EXPORT_FORMATS = ("grouped", "simple", "detailed")
+
+
+class FieldSpec(NamedTuple):
+    """Describes one editable config field.
+
+    A NamedTuple rather than a dataclass so the ~60 specs carry no per-instance
+    __dict__. Kinds: "bool" (Switch), "choice" (Select), "int"/"float" (parsed Input),
+    "str" (raw Input), "path" (stripped Input, empty -> None), "key" (stripped Input)
+    """
+
+    field_id: str
+    section: str
+    name: str
+    kind: str
+
+
+_FIELDS = tuple(FieldSpec(*spec) for spec in (
+    # Git
+    ("git_enabled", "git", "enabled", "bool"),
+    ("git_refresh_interval", "git", "refresh_interval", "int"),
+    ("git_max_refresh_interval", "git", "max_refresh_interval", "int"),
+    ("git_max_commits", "git", "max_commits", "int"),
+    ("git_show_staged", "git", "show_staged", "bool"),
+    ("git_show_modified", "git", "show_modified", "bool"),
+    ("git_show_untracked", "git", "show_untracked", "bool"),
+    ("git_repository_path", "git", "repository_path", "path"),
+    # System
+    ("system_enabled", "system", "enabled", "bool"),
+    ("system_refresh_interval", "system", "refresh_interval", "int"),
+    ("system_show_cpu", "system", "show_cpu", "bool"),
+    ("system_show_ram", "system", "show_ram", "bool"),
+    ("system_show_disk", "system", "show_disk", "bool"),
+    ("system_show_uptime", "system", "show_uptime", "bool"),
+    ("system_show_load_avg", "system", "show_load_avg", "bool"),
+    ("system_cpu_warning", "system", "cpu_warning_threshold", "float"),
+    ("system_cpu_critical", "system", "cpu_critical_threshold", "float"),
+    ("system_ram_warning", "system", "ram_warning_threshold", "float"),
+    ("system_ram_critical", "system", "ram_critical_threshold", "float"),
+    ("system_disk_warning", "system", "disk_warning_threshold", "float"),
+    ("system_disk_critical", "system", "disk_critical_threshold", "float"),
+    ("system_progress_width", "system", "progress_bar_width", "int"),
+    ("system_progress_style", "system", "progress_bar_style", "choice"),
+    # Tasks
+    ("tasks_enabled", "tasks", "enabled", "bool"),
+    ("tasks_file_path", "tasks", "file_path", "str"),
+    ("tasks_default_sort", "tasks", "default_sort", "choice"),
+    ("tasks_show_completed", "tasks", "show_completed", "bool"),
+    ("tasks_max_visible", "tasks", "max_visible_tasks", "int"),
+    ("tasks_truncate_length", "tasks", "truncate_length", "int"),
+    ("tasks_show_categories", "tasks", "show_categories", "bool"),
+    ("tasks_show_due_dates", "tasks", "show_due_dates", "bool"),
+    ("tasks_show_priority_emoji", "tasks", "show_priority_emoji", "bool"),
+    ("tasks_due_soon_days", "tasks", "due_soon_days", "int"),
+    ("tasks_export_format", "tasks", "export_format", "choice"),
+    # Timer
+    ("timer_enabled", "timer", "enabled", "bool"),
+    ("timer_focus_duration", "timer", "focus_duration", "int"),
+    ("timer_break_duration", "timer", "break_duration", "int"),
+    ("timer_long_break_duration", "timer", "long_break_duration", "int"),
+    ("timer_auto_start_break", "timer", "auto_start_break", "bool"),
+    ("timer_show_progress_bar", "timer", "show_progress_bar", "bool"),
+    ("timer_progress_width", "timer", "progress_bar_width", "int"),
+    # Keybindings
+    ("keybinding_quit", "keybindings", "quit", "key"),
+    ("keybinding_help", "keybindings", "help", "key"),
+    ("keybinding_config", "keybindings", "config", "key"),
+    ("keybinding_refresh", "keybindings", "refresh", "key"),
+    ("keybinding_add_task", "keybindings", "add_task", "key"),
+    ("keybinding_edit_task", "keybindings", "edit_task", "key"),
+    ("keybinding_toggle_task", "keybindings", "toggle_task", "key"),
+    ("keybinding_delete_task", "keybindings", "delete_task", "key"),
+    ("keybinding_quick_priority", "keybindings", "quick_priority", "key"),
+    ("keybinding_filter_tasks", "keybindings", "filter_tasks", "key"),
+    ("keybinding_sort_tasks", "keybindings", "sort_tasks", "key"),
+    ("keybinding_export_tasks", "keybindings", "export_tasks", "key"),
+    ("keybinding_filter_high", "keybindings", "filter_high", "key"),
+    ("keybinding_filter_medium", "keybindings", "filter_medium", "key"),
+    ("keybinding_filter_low", "keybindings", "filter_low", "key"),
+    ("keybinding_clear_filters", "keybindings", "clear_filters", "key"),
+    ("keybinding_timer_focus", "keybindings", "timer_focus", "key"),
+    ("keybinding_timer_break", "keybindings", "timer_break", "key"),
+    ("keybinding_timer_stop", "keybindings", "timer_stop", "key"),
+))
+
+_FIELDS_BY_ID = {spec.field_id: spec for spec in _FIELDS}
+
+# TOML spelling of False/True, indexed by the boolean itself
+_BOOL_STR: tuple[str, str] = ("false", "true")
+
+
+def _parse_path(raw: str) -> Optional[str]:
+    """Parse an optional path input; an empty value means None."""
+    return raw.strip() or None
+
+
+# Input kind -> parser for the raw Input value
+_INPUT_PARSERS = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "key": str.strip,
+    "path": _parse_path,
+}
+
+_KEYBINDING_FIELDS = tuple(
+    (spec.field_id, spec.name) for spec in _FIELDS if spec.section == "keybindings"
+)
+_KEYBINDING_IDS = frozenset(field_id for field_id, _ in _KEYBINDING_FIELDS)
+
+
+def _ge(minimum):
+    """Build a check that a value is at least ``minimum``."""
+    return lambda value: value >= minimum
+
+
+def _in_range(low, high):
+    """Build a check that a value lies within ``low``..``high`` inclusive."""
+    return lambda value: low <= value <= high
+
+
+def _one_of(options):
+    """Build a check that a value is one of ``options``."""
+    return lambda value: value in options
+
+
+def _lt(lower_id, upper_id):
+    """Build a check that one field is strictly less than another."""
+    return lambda values: values[lower_id] < values[upper_id]
+
+
+# Per-field rules: (field id, check, error message)
+_SINGLE_VALIDATORS = (
+    ("git_refresh_interval", _ge(1), "Git refresh interval must be >= 1"),
+    ("git_max_refresh_interval", _ge(1), "Git max refresh interval must be >= 1"),
+    ("git_max_commits", _in_range(0, 20), "Git max commits must be 0-20"),
+    ("system_refresh_interval", _ge(1), "System refresh interval must be >= 1"),
+    ("system_cpu_warning", _in_range(0, 100), "CPU warning threshold must be 0-100"),
+    ("system_cpu_critical", _in_range(0, 100), "CPU critical threshold must be 0-100"),
+    ("system_ram_warning", _in_range(0, 100), "RAM warning threshold must be 0-100"),
+    ("system_ram_critical", _in_range(0, 100), "RAM critical threshold must be 0-100"),
+    ("system_disk_warning", _in_range(0, 100), "Disk warning threshold must be 0-100"),
+    ("system_disk_critical", _in_range(0, 100), "Disk critical threshold must be 0-100"),
+    ("tasks_max_visible", _ge(1), "Max visible tasks must be >= 1"),
+    ("tasks_default_sort", _one_of(_SORT_OPTIONS), "Invalid sort option"),
+    ("tasks_export_format", _one_of(_EXPORT_FORMATS), "Invalid export format"),
+    ("timer_focus_duration", _ge(1), "Focus duration must be >= 1"),
+    ("timer_break_duration", _ge(1), "Break duration must be >= 1"),
+    ("timer_long_break_duration", _ge(1), "Long break duration must be >= 1"),
+)
+
+# Cross-field rules: (field ids involved, check over all values, error message)
+_PAIR_VALIDATORS = (
+    (
+        ("system_cpu_warning", "system_cpu_critical"),
+        _lt("system_cpu_warning", "system_cpu_critical"),
+        "CPU warning must be less than critical",
+    ),
+    (
+        ("system_ram_warning", "system_ram_critical"),
+        _lt("system_ram_warning", "system_ram_critical"),
+        "RAM warning must be less than critical",
+    ),
+    (
+        ("system_disk_warning", "system_disk_critical"),
+        _lt("system_disk_warning", "system_disk_critical"),
+        "Disk warning must be less than critical",
+    ),
+)
+
+
+def _render(value) -> object:
+    """Convert a field value to its TOML template substitution.
+
+    Booleans become ``true``/``false`` and an unset path becomes empty.
+    """
+    if isinstance(value, bool):
+        return _BOOL_STR[value]
+    if value is None:
+        return ""
+    return value
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling and an atomic rename.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one. Symlinks are followed, so the link's target is updated
+    rather than replaced by a plain file, and an existing file keeps its
+    permissions.
+
+    Args:
+        path: Destination file
+        data: Complete file contents
+    """
+    path = path.resolve()
+    try:
+        existing_mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if existing_mode is not None:
+            # os.open's mode is filtered through the umask; set it exactly
+            os.chmod(tmp_path, existing_mode)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# TOML written by the editor; placeholders are field IDs plus ui_* values
+_CONFIG_TOML_TEMPLATE = """# DevDash Configuration
+# Generated by DevDash Config Editor
+
+[git]
+enabled = {git_enabled}
+refresh_interval = {git_refresh_interval}
+max_refresh_interval = {git_max_refresh_interval}
+max_commits = {git_max_commits}
+show_staged = {git_show_staged}
+show_modified = {git_show_modified}
+show_untracked = {git_show_untracked}
+repository_path = "{git_repository_path}"
+
+[system]
+enabled = {system_enabled}
+refresh_interval = {system_refresh_interval}
+show_cpu = {system_show_cpu}
+show_ram = {system_show_ram}
+show_disk = {system_show_disk}
+show_uptime = {system_show_uptime}
+show_load_avg = {system_show_load_avg}
+cpu_warning_threshold = {system_cpu_warning}
+cpu_critical_threshold = {system_cpu_critical}
+ram_warning_threshold = {system_ram_warning}
+ram_critical_threshold = {system_ram_critical}
+disk_warning_threshold = {system_disk_warning}
+disk_critical_threshold = {system_disk_critical}
+progress_bar_width = {system_progress_width}
+progress_bar_style = "{system_progress_style}"
+
+[tasks]
+enabled = {tasks_enabled}
+file_path = "{tasks_file_path}"
+default_sort = "{tasks_default_sort}"
+show_completed = {tasks_show_completed}
+max_visible_tasks = {tasks_max_visible}
+truncate_length = {tasks_truncate_length}
+show_categories = {tasks_show_categories}
+show_due_dates = {tasks_show_due_dates}
+show_priority_emoji = {tasks_show_priority_emoji}
+due_soon_days = {tasks_due_soon_days}
+export_format = "{tasks_export_format}"
+
+[timer]
+enabled = {timer_enabled}
+focus_duration = {timer_focus_duration}
+break_duration = {timer_break_duration}
+long_break_duration = {timer_long_break_duration}
+auto_start_break = {timer_auto_start_break}
+notification_enabled = false
+notification_sound = "bell"
+show_progress_bar = {timer_show_progress_bar}
+progress_bar_width = {timer_progress_width}
+
+[ui]
+border_style = "{ui_border_style}"
+panel_padding = {ui_panel_padding}
+show_footer = true
+show_header = true
+compact_view = false
+
+[keybindings]
+# General actions
+quit = "{keybinding_quit}"
+help = "{keybinding_help}"
+config = "{keybinding_config}"
+refresh = "{keybinding_refresh}"
+# Task management
+add_task = "{keybinding_add_task}"
+edit_task = "{keybinding_edit_task}"
+toggle_task = "{keybinding_toggle_task}"
+delete_task = "{keybinding_delete_task}"
+quick_priority = "{keybinding_quick_priority}"
+filter_tasks = "{keybinding_filter_tasks}"
+sort_tasks = "{keybinding_sort_tasks}"
+export_tasks = "{keybinding_export_tasks}"
+# Task filters
+filter_high = "{keybinding_filter_high}"
+filter_medium = "{keybinding_filter_medium}"
+filter_low = "{keybinding_filter_low}"
+clear_filters = "{keybinding_clear_filters}"
+# Timer controls
+timer_focus = "{keybinding_timer_focus}"
+timer_break = "{keybinding_timer_break}"
+timer_stop = "{keybinding_timer_stop}"
+"""
+
+
+class ConfigRow(Horizontal):
+    """A labelled editor row: a fixed-width label followed by its field widget."""
+
+    DEFAULT_CLASSES = "config-row"
+
+    def __init__(self, label: str, field: Widget) -> None:
+        """Initialize the row.
+
+        Args:
+            label: Text shown to the left of the field
+            field: Input, Switch or Select widget being labelled
+        """
+        super().__init__()
+        self._label = label
+        self._field = field
+
+    def compose(self) -> ComposeResult:
+        """Compose the label and field."""
+        yield Static(self._label, classes="config-label")
+        yield self._field
+
+
 class ConfigEditorModal(ModalScreen):
     """Modal screen for editing DevDash configuration."""
 
-    CSS = """
-    ConfigEditorModal {
-        align: center middle;
-    }
-
-    #config-dialog {
-        width: 90;
-        height: 55;
-        background: $surface;
-        border: thick $primary;
-        padding: 1 2;
-    }
-
-    #config-title {
-        width: 100%;
-        text-align: center;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        text-style: bold;
-    }
-
-    #config-tabs {
-        width: 100%;
-        height: 38;
-        margin: 0;
-    }
-
-    TabbedContent {
-        height: 100%;
-    }
-
-    TabbedContent ContentSwitcher {
-        height: 100%;
-    }
-
-    TabPane {
-        padding: 0;
-        height: 100%;
-    }
-
-    .tab-content {
-        width: 100%;
-        height: 100%;
-        padding: 1;
-        overflow-y: auto;
-    }
-
-    .config-section {
-        padding: 1;
-        height: auto;
-        width: 100%;
-    }
-
-    .section-title {
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-        height: auto;
-    }
-
-    .config-row {
-        height: auto;
-        min-height: 3;
-        margin: 0 0 1 0;
-        layout: horizontal;
-    }
-
-    .config-label {
-        width: 35%;
-        padding: 1;
-        height: auto;
-    }
-
-    .config-input {
-        width: 65%;
-        height: auto;
-    }
-
-    .instructions {
-        padding: 1;
-        margin: 0 0 1 0;
-        background: $boost;
-        border: solid yellow;
-    }
-
-    Input {
-        width: 100%;
-        height: auto;
-        min-height: 3;
-        border: tall $accent;
-        background: $surface;
-        color: $text;
-    }
-
-    Input:focus {
-        border: tall cyan;
-        background: $boost;
-    }
-
-    Input:hover {
-        border: tall green;
-        background: $surface-lighten-1;
-    }
-
-    Switch {
-        width: auto;
-        height: auto;
-        background: $surface;
-    }
-
-    Switch:focus {
-        background: $boost;
-    }
-
-    Select {
-        width: 100%;
-        height: auto;
-        min-height: 3;
-        border: tall $accent;
-        background: $surface;
-    }
-
-    Select:focus {
-        border: tall cyan;
-        background: $boost;
-    }
-
-    #button-row {
-        width: 100%;
-        height: auto;
-        align: center middle;
-        margin: 1 0;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    #status-message {
-        width: 100%;
-        text-align: center;
-        height: auto;
-        min-height: 1;
-        margin: 0;
-        padding: 0 1;
-    }
-
-    #status-message.success {
-        background: green;
-        color: white;
-    }
-
-    #status-message.error {
-        background: red;
-        color: white;
-    }
-    """
+    CSS_PATH = "config_editor_modal.tcss"
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel", show=True),
         Binding("ctrl+s", "save", "Save", show=True),
-        ("tab", "focus_next", "Next field"),
-        ("shift+tab", "focus_previous", "Previous field"),
-    ]
+        Binding("tab", "focus_next", "Next field"),
+        Binding("shift+tab", "focus_previous", "Previous field"),
+    )
 
     def __init__(self, config: DevDashConfig, config_path: Optional[Path] = None):
         """Initialize the config editor modal.
@@ -193,6 +369,10 @@ class ConfigEditorModal(ModalScreen):
         super().__init__()
         self.config = config
         self.config_path = config_path
+        # IDs of fields whose value differs from the loaded config
+        self._dirty: set[str] = set()
+        # Last (message, error) shown, to skip redundant status updates
+        self._status_state: Optional[tuple[str, bool]] = None
 
     def compose(self) -> ComposeResult:
         """Compose the config editor UI."""
@@ -213,344 +393,394 @@ class ConfigEditorModal(ModalScreen):
                     with Container(classes="tab-content"):
                         yield Static("━━━ [bold cyan]Git Panel[/] ━━━", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Enabled:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Enabled:",
+                            Switch(
                                 value=self.config.git.enabled,
-                                id="git_enabled"
-                            )
+                                id="git_enabled",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Refresh Interval (s):", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Refresh Interval (s):",
+                            Input(
                                 value=str(self.config.git.refresh_interval),
                                 placeholder="5",
                                 id="git_refresh_interval",
-                                classes="config-input"
-                            )
-
-                        with Horizontal(classes="config-row"):
-                            yield Static("Max Commits:", classes="config-label")
-                            yield Input(
+                                classes="config-input",
+                            ),
+                        )
+
+                        yield ConfigRow(
+                            "Max Idle Interval (s):",
+                            Input(
+                                value=str(self.config.git.max_refresh_interval),
+                                placeholder="60",
+                                id="git_max_refresh_interval",
+                                classes="config-input",
+                            ),
+                        )
+
+                        yield ConfigRow(
+                            "Max Commits:",
+                            Input(
                                 value=str(self.config.git.max_commits),
                                 placeholder="3",
                                 id="git_max_commits",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Staged:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Staged:",
+                            Switch(
                                 value=self.config.git.show_staged,
-                                id="git_show_staged"
-                            )
+                                id="git_show_staged",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Modified:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Modified:",
+                            Switch(
                                 value=self.config.git.show_modified,
-                                id="git_show_modified"
-                            )
+                                id="git_show_modified",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Untracked:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Untracked:",
+                            Switch(
                                 value=self.config.git.show_untracked,
-                                id="git_show_untracked"
-                            )
+                                id="git_show_untracked",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Repository Path:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Repository Path:",
+                            Input(
                                 value=self.config.git.repository_path or "",
                                 placeholder="(leave empty for current directory)",
                                 id="git_repository_path",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
                 # System Panel Tab
                 with TabPane("System", id="system-tab"):
                     with Container(classes="tab-content"):
                         yield Static("━━━ [bold green]System Panel[/] ━━━", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Enabled:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Enabled:",
+                            Switch(
                                 value=self.config.system.enabled,
-                                id="system_enabled"
-                            )
+                                id="system_enabled",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Refresh Interval (s):", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Refresh Interval (s):",
+                            Input(
                                 value=str(self.config.system.refresh_interval),
                                 placeholder="1",
                                 id="system_refresh_interval",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show CPU:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show CPU:",
+                            Switch(
                                 value=self.config.system.show_cpu,
-                                id="system_show_cpu"
-                            )
+                                id="system_show_cpu",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show RAM:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show RAM:",
+                            Switch(
                                 value=self.config.system.show_ram,
-                                id="system_show_ram"
-                            )
+                                id="system_show_ram",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Disk:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Disk:",
+                            Switch(
                                 value=self.config.system.show_disk,
-                                id="system_show_disk"
-                            )
+                                id="system_show_disk",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Uptime:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Uptime:",
+                            Switch(
                                 value=self.config.system.show_uptime,
-                                id="system_show_uptime"
-                            )
+                                id="system_show_uptime",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Load Average:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Load Average:",
+                            Switch(
                                 value=self.config.system.show_load_avg,
-                                id="system_show_load_avg"
-                            )
+                                id="system_show_load_avg",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("CPU Warning %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "CPU Warning %:",
+                            Input(
                                 value=str(self.config.system.cpu_warning_threshold),
                                 placeholder="60.0",
                                 id="system_cpu_warning",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("CPU Critical %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "CPU Critical %:",
+                            Input(
                                 value=str(self.config.system.cpu_critical_threshold),
                                 placeholder="80.0",
                                 id="system_cpu_critical",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("RAM Warning %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "RAM Warning %:",
+                            Input(
                                 value=str(self.config.system.ram_warning_threshold),
                                 placeholder="60.0",
                                 id="system_ram_warning",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("RAM Critical %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "RAM Critical %:",
+                            Input(
                                 value=str(self.config.system.ram_critical_threshold),
                                 placeholder="80.0",
                                 id="system_ram_critical",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Disk Warning %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Disk Warning %:",
+                            Input(
                                 value=str(self.config.system.disk_warning_threshold),
                                 placeholder="60.0",
                                 id="system_disk_warning",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Disk Critical %:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Disk Critical %:",
+                            Input(
                                 value=str(self.config.system.disk_critical_threshold),
                                 placeholder="80.0",
                                 id="system_disk_critical",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Progress Bar Width:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Progress Bar Width:",
+                            Input(
                                 value=str(self.config.system.progress_bar_width),
                                 placeholder="10",
                                 id="system_progress_width",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Progress Bar Style:", classes="config-label")
-                            yield Select.from_values(
+                        yield ConfigRow(
+                            "Progress Bar Style:",
+                            Select.from_values(
                                 ["blocks", "bars", "dots"],
                                 value=self.config.system.progress_bar_style,
                                 allow_blank=False,
-                                id="system_progress_style"
-                            )
+                                id="system_progress_style",
+                            ),
+                        )
 
                 # Tasks Panel Tab
                 with TabPane("Tasks", id="tasks-tab"):
                     with Container(classes="tab-content"):
                         yield Static("━━━ [bold yellow]Tasks Panel[/] ━━━", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Enabled:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Enabled:",
+                            Switch(
                                 value=self.config.tasks.enabled,
-                                id="tasks_enabled"
-                            )
+                                id="tasks_enabled",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("File Path:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "File Path:",
+                            Input(
                                 value=self.config.tasks.file_path,
                                 placeholder=".devdash_tasks.json",
                                 id="tasks_file_path",
-                                classes="config-input"
-                            )
-
-                        with Horizontal(classes="config-row"):
-                            yield Static("Default Sort:", classes="config-label")
-                            yield Select.from_values(
-                                ["created", "priority", "due_date", "text"],
+                                classes="config-input",
+                            ),
+                        )
+
+                        yield ConfigRow(
+                            "Default Sort:",
+                            Select.from_values(
+                                _SORT_OPTIONS,
                                 value=self.config.tasks.default_sort,
                                 allow_blank=False,
-                                id="tasks_default_sort"
-                            )
+                                id="tasks_default_sort",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Completed:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Completed:",
+                            Switch(
                                 value=self.config.tasks.show_completed,
-                                id="tasks_show_completed"
-                            )
+                                id="tasks_show_completed",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Max Visible Tasks:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Max Visible Tasks:",
+                            Input(
                                 value=str(self.config.tasks.max_visible_tasks),
                                 placeholder="20",
                                 id="tasks_max_visible",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Truncate Length:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Truncate Length:",
+                            Input(
                                 value=str(self.config.tasks.truncate_length),
                                 placeholder="40",
                                 id="tasks_truncate_length",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Categories:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Categories:",
+                            Switch(
                                 value=self.config.tasks.show_categories,
-                                id="tasks_show_categories"
-                            )
+                                id="tasks_show_categories",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Due Dates:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Due Dates:",
+                            Switch(
                                 value=self.config.tasks.show_due_dates,
-                                id="tasks_show_due_dates"
-                            )
+                                id="tasks_show_due_dates",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Priority Emoji:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Priority Emoji:",
+                            Switch(
                                 value=self.config.tasks.show_priority_emoji,
-                                id="tasks_show_priority_emoji"
-                            )
+                                id="tasks_show_priority_emoji",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Due Soon Days:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Due Soon Days:",
+                            Input(
                                 value=str(self.config.tasks.due_soon_days),
                                 placeholder="3",
                                 id="tasks_due_soon_days",
-                                classes="config-input"
-                            )
-
-                        with Horizontal(classes="config-row"):
-                            yield Static("Export Format:", classes="config-label")
-                            yield Select.from_values(
-                                ["grouped", "simple", "detailed"],
+                                classes="config-input",
+                            ),
+                        )
+
+                        yield ConfigRow(
+                            "Export Format:",
+                            Select.from_values(
+                                _EXPORT_FORMATS,
                                 value=self.config.tasks.export_format,
                                 allow_blank=False,
-                                id="tasks_export_format"
-                            )
+                                id="tasks_export_format",
+                            ),
+                        )
 
                 # Timer Panel Tab
                 with TabPane("Timer", id="timer-tab"):
                     with Container(classes="tab-content"):
                         yield Static("━━━ [bold red]Timer Panel[/] ━━━", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Enabled:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Enabled:",
+                            Switch(
                                 value=self.config.timer.enabled,
-                                id="timer_enabled"
-                            )
+                                id="timer_enabled",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Focus Duration (min):", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Focus Duration (min):",
+                            Input(
                                 value=str(self.config.timer.focus_duration),
                                 placeholder="25",
                                 id="timer_focus_duration",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Break Duration (min):", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Break Duration (min):",
+                            Input(
                                 value=str(self.config.timer.break_duration),
                                 placeholder="5",
                                 id="timer_break_duration",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Long Break Duration (min):", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Long Break Duration (min):",
+                            Input(
                                 value=str(self.config.timer.long_break_duration),
                                 placeholder="15",
                                 id="timer_long_break_duration",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Auto Start Break:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Auto Start Break:",
+                            Switch(
                                 value=self.config.timer.auto_start_break,
-                                id="timer_auto_start_break"
-                            )
+                                id="timer_auto_start_break",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Show Progress Bar:", classes="config-label")
-                            yield Switch(
+                        yield ConfigRow(
+                            "Show Progress Bar:",
+                            Switch(
                                 value=self.config.timer.show_progress_bar,
-                                id="timer_show_progress_bar"
-                            )
+                                id="timer_show_progress_bar",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Progress Bar Width:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Progress Bar Width:",
+                            Input(
                                 value=str(self.config.timer.progress_bar_width),
                                 placeholder="20",
                                 id="timer_progress_width",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
                 # Keybindings Tab
                 with TabPane("Keybindings", id="keybindings-tab"):
@@ -561,185 +791,204 @@ class ConfigEditorModal(ModalScreen):
                         # General actions
                         yield Static("[bold]General Actions[/]", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Quit:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Quit:",
+                            Input(
                                 value=self.config.keybindings.quit,
                                 placeholder="q",
                                 id="keybinding_quit",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Help:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Help:",
+                            Input(
                                 value=self.config.keybindings.help,
                                 placeholder="?",
                                 id="keybinding_help",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Config:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Config:",
+                            Input(
                                 value=self.config.keybindings.config,
                                 placeholder="c",
                                 id="keybinding_config",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Refresh:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Refresh:",
+                            Input(
                                 value=self.config.keybindings.refresh,
                                 placeholder="r",
                                 id="keybinding_refresh",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
                         # Task management
                         yield Static("[bold]Task Management[/]", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Add Task:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Add Task:",
+                            Input(
                                 value=self.config.keybindings.add_task,
                                 placeholder="a",
                                 id="keybinding_add_task",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Edit Task:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Edit Task:",
+                            Input(
                                 value=self.config.keybindings.edit_task,
                                 placeholder="e",
                                 id="keybinding_edit_task",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Toggle Task:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Toggle Task:",
+                            Input(
                                 value=self.config.keybindings.toggle_task,
                                 placeholder="space",
                                 id="keybinding_toggle_task",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Delete Task:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Delete Task:",
+                            Input(
                                 value=self.config.keybindings.delete_task,
                                 placeholder="d",
                                 id="keybinding_delete_task",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Quick Priority:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Quick Priority:",
+                            Input(
                                 value=self.config.keybindings.quick_priority,
                                 placeholder="p",
                                 id="keybinding_quick_priority",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Filter Tasks:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Filter Tasks:",
+                            Input(
                                 value=self.config.keybindings.filter_tasks,
                                 placeholder="f",
                                 id="keybinding_filter_tasks",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Sort Tasks:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Sort Tasks:",
+                            Input(
                                 value=self.config.keybindings.sort_tasks,
                                 placeholder="s",
                                 id="keybinding_sort_tasks",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Export Tasks:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Export Tasks:",
+                            Input(
                                 value=self.config.keybindings.export_tasks,
                                 placeholder="x",
                                 id="keybinding_export_tasks",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
                         # Task filters
                         yield Static("[bold]Task Filters[/]", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Filter High Priority:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Filter High Priority:",
+                            Input(
                                 value=self.config.keybindings.filter_high,
                                 placeholder="1",
                                 id="keybinding_filter_high",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Filter Medium Priority:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Filter Medium Priority:",
+                            Input(
                                 value=self.config.keybindings.filter_medium,
                                 placeholder="2",
                                 id="keybinding_filter_medium",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Filter Low Priority:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Filter Low Priority:",
+                            Input(
                                 value=self.config.keybindings.filter_low,
                                 placeholder="3",
                                 id="keybinding_filter_low",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Clear Filters:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Clear Filters:",
+                            Input(
                                 value=self.config.keybindings.clear_filters,
                                 placeholder="0",
                                 id="keybinding_clear_filters",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
                         # Timer controls
                         yield Static("[bold]Timer Controls[/]", classes="section-title")
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Timer Focus:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Timer Focus:",
+                            Input(
                                 value=self.config.keybindings.timer_focus,
                                 placeholder="F",
                                 id="keybinding_timer_focus",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Timer Break:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Timer Break:",
+                            Input(
                                 value=self.config.keybindings.timer_break,
                                 placeholder="B",
                                 id="keybinding_timer_break",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
-                        with Horizontal(classes="config-row"):
-                            yield Static("Timer Stop:", classes="config-label")
-                            yield Input(
+                        yield ConfigRow(
+                            "Timer Stop:",
+                            Input(
                                 value=self.config.keybindings.timer_stop,
                                 placeholder="S",
                                 id="keybinding_timer_stop",
-                                classes="config-input"
-                            )
+                                classes="config-input",
+                            ),
+                        )
 
     def _show_status(self, message: str, error: bool = False) -> None:
         """Show a status message.
@@ -748,14 +997,14 @@ class ConfigEditorModal(ModalScreen):
             message: Message to display
             error: If True, show as error (red), otherwise success (green)
         """
+        if (message, error) == self._status_state:
+            return
+        self._status_state = (message, error)
+
         status_widget = self.query_one("#status-message", Static)
         status_widget.update(message)
-        if error:
-            status_widget.add_class("error")
-            status_widget.remove_class("success")
-        else:
-            status_widget.add_class("success")
-            status_widget.remove_class("error")
+        status_widget.set_class(error, "error")
+        status_widget.set_class(not error, "success")
 
     def _get_input_value(self, input_id: str) -> str:
         """Get value from an input field.
@@ -790,148 +1039,119 @@ class ConfigEditorModal(ModalScreen):
         """
         return str(self.query_one(f"#{select_id}", Select).value)
 
+    def _seed_value(self, field_id: str):
+        """Get the value a field widget was seeded with from the current config.
+
+        Args:
+            field_id: ID of the field widget
+
+        Returns:
+            The value as the widget reports it (str for inputs, bool for switches)
+        """
+        spec = _FIELDS_BY_ID[field_id]
+        value = getattr(getattr(self.config, spec.section), spec.name)
+        if spec.kind in ("bool", "choice"):
+            return value
+        if value is None:
+            return ""
+        return str(value)
+
+    def _mark_dirty(self, field_id: Optional[str], value) -> None:
+        """Track whether a field differs from the value it was seeded with.
+
+        Args:
+            field_id: ID of the widget that changed
+            value: New widget value
+        """
+        if field_id not in _FIELDS_BY_ID:
+            return
+        if value == self._seed_value(field_id):
+            self._dirty.discard(field_id)
+        else:
+            self._dirty.add(field_id)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Record edited input fields."""
+        self._mark_dirty(event.input.id, event.value)
+
+    def on_switch_changed(self, event: Switch.Changed) -> None:
+        """Record toggled switches."""
+        self._mark_dirty(event.switch.id, event.value)
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Record changed selections."""
+        self._mark_dirty(event.select.id, event.value)
+
+    def _read_field(self, field_id: str, kind: str):
+        """Read and parse the current value of a field widget.
+
+        Args:
+            field_id: ID of the field widget
+            kind: Field kind from the field table
+
+        Returns:
+            The parsed value
+
+        Raises:
+            ValueError: If a numeric field does not parse
+        """
+        if kind == "bool":
+            return self._get_switch_value(field_id)
+        if kind == "choice":
+            return self._get_select_value(field_id)
+        return _INPUT_PARSERS[kind](self._get_input_value(field_id))
+
+    def _collect_values(self) -> dict:
+        """Collect field values, parsing only the fields the user changed.
+
+        Unchanged fields are copied from the current configuration.
+
+        Returns:
+            Mapping of field ID to value
+        """
+        values = {}
+        for field_id, section, name, kind in _FIELDS:
+            if field_id in self._dirty:
+                values[field_id] = self._read_field(field_id, kind)
+            else:
+                values[field_id] = getattr(getattr(self.config, section), name)
+        return values
+
     def _save_config(self) -> None:
         """Save the configuration to file."""
         try:
             # Build updated config from input values
-            # Git
-            git_enabled = self._get_switch_value("git_enabled")
-            git_refresh = int(self._get_input_value("git_refresh_interval"))
-            git_commits = int(self._get_input_value("git_max_commits"))
-            git_show_staged = self._get_switch_value("git_show_staged")
-            git_show_modified = self._get_switch_value("git_show_modified")
-            git_show_untracked = self._get_switch_value("git_show_untracked")
-            git_repo_path = self._get_input_value("git_repository_path").strip()
-            # Convert empty string to None
-            git_repo_path = git_repo_path if git_repo_path else None
-
-            # System
-            system_enabled = self._get_switch_value("system_enabled")
-            system_refresh = int(self._get_input_value("system_refresh_interval"))
-            system_show_cpu = self._get_switch_value("system_show_cpu")
-            system_show_ram = self._get_switch_value("system_show_ram")
-            system_show_disk = self._get_switch_value("system_show_disk")
-            system_show_uptime = self._get_switch_value("system_show_uptime")
-            system_show_load_avg = self._get_switch_value("system_show_load_avg")
-            cpu_warning = float(self._get_input_value("system_cpu_warning"))
-            cpu_critical = float(self._get_input_value("system_cpu_critical"))
-            ram_warning = float(self._get_input_value("system_ram_warning"))
-            ram_critical = float(self._get_input_value("system_ram_critical"))
-            disk_warning = float(self._get_input_value("system_disk_warning"))
-            disk_critical = float(self._get_input_value("system_disk_critical"))
-            system_progress_width = int(self._get_input_value("system_progress_width"))
-            system_progress_style = self._get_select_value("system_progress_style")
-
-            # Tasks
-            tasks_enabled = self._get_switch_value("tasks_enabled")
-            tasks_file = self._get_input_value("tasks_file_path")
-            tasks_sort = self._get_select_value("tasks_default_sort")
-            tasks_show_completed = self._get_switch_value("tasks_show_completed")
-            tasks_max = int(self._get_input_value("tasks_max_visible"))
-            tasks_truncate = int(self._get_input_value("tasks_truncate_length"))
-            tasks_show_categories = self._get_switch_value("tasks_show_categories")
-            tasks_show_due_dates = self._get_switch_value("tasks_show_due_dates")
-            tasks_show_priority_emoji = self._get_switch_value("tasks_show_priority_emoji")
-            tasks_due_soon_days = int(self._get_input_value("tasks_due_soon_days"))
-            tasks_export_format = self._get_select_value("tasks_export_format")
-
-            # Timer
-            timer_enabled = self._get_switch_value("timer_enabled")
-            timer_focus = int(self._get_input_value("timer_focus_duration"))
-            timer_break = int(self._get_input_value("timer_break_duration"))
-            timer_long_break = int(self._get_input_value("timer_long_break_duration"))
-            timer_auto_start_break = self._get_switch_value("timer_auto_start_break")
-            timer_show_progress_bar = self._get_switch_value("timer_show_progress_bar")
-            timer_progress = int(self._get_input_value("timer_progress_width"))
-
-            # Keybindings
-            kb_quit = self._get_input_value("keybinding_quit").strip()
-            kb_help = self._get_input_value("keybinding_help").strip()
-            kb_config = self._get_input_value("keybinding_config").strip()
-            kb_refresh = self._get_input_value("keybinding_refresh").strip()
-            kb_add_task = self._get_input_value("keybinding_add_task").strip()
-            kb_edit_task = self._get_input_value("keybinding_edit_task").strip()
-            kb_toggle_task = self._get_input_value("keybinding_toggle_task").strip()
-            kb_delete_task = self._get_input_value("keybinding_delete_task").strip()
-            kb_quick_priority = self._get_input_value("keybinding_quick_priority").strip()
-            kb_filter_tasks = self._get_input_value("keybinding_filter_tasks").strip()
-            kb_sort_tasks = self._get_input_value("keybinding_sort_tasks").strip()
-            kb_export_tasks = self._get_input_value("keybinding_export_tasks").strip()
-            kb_filter_high = self._get_input_value("keybinding_filter_high").strip()
-            kb_filter_medium = self._get_input_value("keybinding_filter_medium").strip()
-            kb_filter_low = self._get_input_value("keybinding_filter_low").strip()
-            kb_clear_filters = self._get_input_value("keybinding_clear_filters").strip()
-            kb_timer_focus = self._get_input_value("keybinding_timer_focus").strip()
-            kb_timer_break = self._get_input_value("keybinding_timer_break").strip()
-            kb_timer_stop = self._get_input_value("keybinding_timer_stop").strip()
-
-            # Validate values
-            errors = []
-
-            if git_refresh < 1:
-                errors.append("Git refresh interval must be >= 1")
-            if git_commits < 0 or git_commits > 20:
-                errors.append("Git max commits must be 0-20")
-
-            if system_refresh < 1:
-                errors.append("System refresh interval must be >= 1")
-            if cpu_warning < 0 or cpu_warning > 100:
-                errors.append("CPU warning threshold must be 0-100")
-            if cpu_critical < 0 or cpu_critical > 100:
-                errors.append("CPU critical threshold must be 0-100")
-            if cpu_warning >= cpu_critical:
-                errors.append("CPU warning must be less than critical")
-            if ram_warning < 0 or ram_warning > 100:
-                errors.append("RAM warning threshold must be 0-100")
-            if ram_critical < 0 or ram_critical > 100:
-                errors.append("RAM critical threshold must be 0-100")
-            if ram_warning >= ram_critical:
-                errors.append("RAM warning must be less than critical")
-            if disk_warning < 0 or disk_warning > 100:
-                errors.append("Disk warning threshold must be 0-100")
-            if disk_critical < 0 or disk_critical > 100:
-                errors.append("Disk critical threshold must be 0-100")
-            if disk_warning >= disk_critical:
-                errors.append("Disk warning must be less than critical")
-
-            if tasks_max < 1:
-                errors.append("Max visible tasks must be >= 1")
-            if tasks_sort not in ["created", "priority", "due_date", "text"]:
-                errors.append("Invalid sort option")
-            if tasks_export_format not in ["grouped", "simple", "detailed"]:
-                errors.append("Invalid export format")
-
-            if timer_focus < 1:
-                errors.append("Focus duration must be >= 1")
-            if timer_break < 1:
-                errors.append("Break duration must be >= 1")
-            if timer_long_break < 1:
-                errors.append("Long break duration must be >= 1")
-
-            # Validate keybindings - check for duplicates
-            keybindings_list = [
-                ("quit", kb_quit), ("help", kb_help), ("config", kb_config), ("refresh", kb_refresh),
-                ("add_task", kb_add_task), ("edit_task", kb_edit_task), ("toggle_task", kb_toggle_task),
-                ("delete_task", kb_delete_task), ("quick_priority", kb_quick_priority),
-                ("filter_tasks", kb_filter_tasks), ("sort_tasks", kb_sort_tasks),
-                ("export_tasks", kb_export_tasks), ("filter_high", kb_filter_high),
-                ("filter_medium", kb_filter_medium), ("filter_low", kb_filter_low),
-                ("clear_filters", kb_clear_filters), ("timer_focus", kb_timer_focus),
-                ("timer_break", kb_timer_break), ("timer_stop", kb_timer_stop)
+            v = self._collect_values()
+            dirty = self._dirty
+
+            # Validate changed values (plus invariants touching a changed field)
+            errors = [
+                message
+                for field_id, check, message in _SINGLE_VALIDATORS
+                if field_id in dirty and not check(v[field_id])
             ]
-
-            # Check for empty keybindings
-            for action_name, key_value in keybindings_list:
-                if not key_value:
-                    errors.append(f"Keybinding for {action_name} cannot be empty")
-
-            # Check for duplicate keybindings
-            key_map = {}
-            for action_name, key_value in keybindings_list:
-                if key_value and key_value in key_map:
-                    errors.append(f"Duplicate keybinding: '{key_value}' used for both {key_map[key_value]} and {action_name}")
-                elif key_value:
-                    key_map[key_value] = action_name
+            errors.extend(
+                message
+                for field_ids, check, message in _PAIR_VALIDATORS
+                if not dirty.isdisjoint(field_ids) and not check(v)
+            )
+
+            # Validate keybindings as a set - any edit can introduce a duplicate
+            if not dirty.isdisjoint(_KEYBINDING_IDS):
+                keybindings_list = [(name, v[field_id]) for field_id, name in _KEYBINDING_FIELDS]
+
+                # Check for empty keybindings
+                for action_name, key_value in keybindings_list:
+                    if not key_value:
+                        errors.append(f"Keybinding for {action_name} cannot be empty")
+
+                # Check for duplicate keybindings
+                key_map = {}
+                for action_name, key_value in keybindings_list:
+                    if key_value and key_value in key_map:
+                        errors.append(f"Duplicate keybinding: '{key_value}' used for both {key_map[key_value]} and {action_name}")
+                    elif key_value:
+                        key_map[key_value] = action_name
 
             if errors:
                 self._show_status(f"Validation errors: {', '.join(errors)}", error=True)
@@ -949,97 +1169,26 @@ class ConfigEditorModal(ModalScreen):
                     # Create in current directory
                     config_file = Path.cwd() / ".devdash.toml"
 
-            # Build TOML content
-            toml_content = f"""# DevDash Configuration
-# Generated by DevDash Config Editor
-
-[git]
-enabled = {str(git_enabled).lower()}
-refresh_interval = {git_refresh}
-max_commits = {git_commits}
-show_staged = {str(git_show_staged).lower()}
-show_modified = {str(git_show_modified).lower()}
-show_untracked = {str(git_show_untracked).lower()}
-repository_path = "{git_repo_path if git_repo_path else ""}"
-
-[system]
-enabled = {str(system_enabled).lower()}
-refresh_interval = {system_refresh}
-show_cpu = {str(system_show_cpu).lower()}
-show_ram = {str(system_show_ram).lower()}
-show_disk = {str(system_show_disk).lower()}
-show_uptime = {str(system_show_uptime).lower()}
-show_load_avg = {str(system_show_load_avg).lower()}
-cpu_warning_threshold = {cpu_warning}
-cpu_critical_threshold = {cpu_critical}
-ram_warning_threshold = {ram_warning}
-ram_critical_threshold = {ram_critical}
-disk_warning_threshold = {disk_warning}
-disk_critical_threshold = {disk_critical}
-progress_bar_width = {system_progress_width}
-progress_bar_style = "{system_progress_style}"
-
-[tasks]
-enabled = {str(tasks_enabled).lower()}
-file_path = "{tasks_file}"
-default_sort = "{tasks_sort}"
-show_completed = {str(tasks_show_completed).lower()}
-max_visible_tasks = {tasks_max}
-truncate_length = {tasks_truncate}
-show_categories = {str(tasks_show_categories).lower()}
-show_due_dates = {str(tasks_show_due_dates).lower()}
-show_priority_emoji = {str(tasks_show_priority_emoji).lower()}
-due_soon_days = {tasks_due_soon_days}
-export_format = "{tasks_export_format}"
-
-[timer]
-enabled = {str(timer_enabled).lower()}
-focus_duration = {timer_focus}
-break_duration = {timer_break}
-long_break_duration = {timer_long_break}
-auto_start_break = {str(timer_auto_start_break).lower()}
-notification_enabled = false
-notification_sound = "bell"
-show_progress_bar = {str(timer_show_progress_bar).lower()}
-progress_bar_width = {timer_progress}
-
-[ui]
-border_style = "{self.config.ui.border_style}"
-panel_padding = {self.config.ui.panel_padding}
-show_footer = true
-show_header = true
-compact_view = false
-
-[keybindings]
-# General actions
-quit = "{kb_quit}"
-help = "{kb_help}"
-config = "{kb_config}"
-refresh = "{kb_refresh}"
-# Task management
-add_task = "{kb_add_task}"
-edit_task = "{kb_edit_task}"
-toggle_task = "{kb_toggle_task}"
-delete_task = "{kb_delete_task}"
-quick_priority = "{kb_quick_priority}"
-filter_tasks = "{kb_filter_tasks}"
-sort_tasks = "{kb_sort_tasks}"
-export_tasks = "{kb_export_tasks}"
-# Task filters
-filter_high = "{kb_filter_high}"
-filter_medium = "{kb_filter_medium}"
-filter_low = "{kb_filter_low}"
-clear_filters = "{kb_clear_filters}"
-# Timer controls
-timer_focus = "{kb_timer_focus}"
-timer_break = "{kb_timer_break}"
-timer_stop = "{kb_timer_stop}"
-"""
+            # Render TOML content
+            values = {field_id: _render(value) for field_id, value in v.items()}
+            values["ui_border_style"] = self.config.ui.border_style
+            values["ui_panel_padding"] = self.config.ui.panel_padding
+            toml_content = _CONFIG_TOML_TEMPLATE.format_map(values)
+
+            # Skip the write if the file already matches. Still dismiss with
+            # True: the user saved, and the app's reload notices nothing changed
+            data = toml_content.encode("utf-8")
+            try:
+                unchanged = config_file.read_bytes() == data
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self.dismiss(True)
+                return
 
             # Write to file
             config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_file, 'w') as f:
-                f.write(toml_content)
+            _write_atomic(config_file, data)
 
             # Dismiss with True to trigger hot-reload in main app
             # Do this immediately without showing status message
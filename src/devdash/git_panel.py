@@ -2,23 +2,156 @@
 Git panel widget - displays repository information
 """
 
+import os
+import shutil
+import subprocess
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.widgets import Static
 from textual.containers import Container
 from textual.reactive import reactive
 from textual.timer import Timer
+from textual.worker import get_current_worker
 
 try:
-    from git import Repo, InvalidGitRepositoryError, GitCommandError
-    GIT_AVAILABLE = True
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
 except ImportError:
-    GIT_AVAILABLE = False
+    WATCHDOG_AVAILABLE = False
 
 from devdash.config.schema import GitConfig
 
+# Run a full status at least every refresh_interval * this many seconds,
+# even on fingerprint hits, so working-tree edits that don't touch
+# .git/index or HEAD still show up in bounded time
+_MAX_FINGERPRINT_HITS = 5
+
+# Seconds to wait before looking for a repository again after a miss
+_REPO_RETRY_SECONDS = 30
+
+# Seconds that git output is shared between panels showing the same repo
+_GIT_OUTPUT_TTL = 1.0
+
+# Seconds to collect .git filesystem events into a single refresh
+_WATCH_DEBOUNCE = 0.25
+
+# Watchdog event types that can mean the repository changed; opened/closed
+# events fire for our own reads and would make the panel refresh itself
+_WATCH_EVENT_TYPES = frozenset({"modified", "created", "deleted", "moved"})
+
+# (repo_dir, fingerprint, args) -> (monotonic time, output), shared by all GitPanels
+_git_output_cache: dict = {}
+_git_output_lock = threading.Lock()
+
+# Styled fragments for the panel content (treated as immutable)
+_NO_CHANGES_TRACKED = Text("No changes tracked", "dim")
+_NO_COMMITS = Text("  No commits", "dim")
+_NOT_A_REPO = Text.assemble(
+    ("Not a git repository", "yellow"),
+    "\n\n",
+    ("Navigate to a git repository to see status", "dim"),
+)
+_GIT_NOT_FOUND = Text("git executable not found", "red")
+
+
+if WATCHDOG_AVAILABLE:
+
+    class _GitDirHandler(FileSystemEventHandler):
+        """Forward filesystem events in a ``.git`` directory to a GitPanel."""
+
+        def __init__(self, panel: "GitPanel") -> None:
+            super().__init__()
+            self._panel = panel
+
+        def on_any_event(self, event) -> None:
+            """Schedule a debounced panel refresh (called on the observer thread)."""
+            if event.event_type not in _WATCH_EVENT_TYPES:
+                return
+            # Lock files come and go around every git write, including the
+            # ones that produce the real change event
+            if event.src_path.endswith(".lock") or getattr(event, "dest_path", "").endswith(".lock"):
+                return
+            panel = self._panel
+            # One refresh per burst: later events land inside the debounce
+            # window and are covered by the refresh it schedules
+            if panel._watch_refresh_pending:
+                return
+            panel._watch_refresh_pending = True
+            try:
+                panel.app.call_from_thread(panel._schedule_watch_refresh)
+            except RuntimeError:
+                pass  # App is shutting down
+
+
+@lru_cache(maxsize=None)
+def _git_available() -> bool:
+    """Check (once, on first use) whether a git executable is on PATH."""
+    return shutil.which("git") is not None
+
+
+def _run_git(repo_dir: str, *args: str) -> str:
+    """Run a git command in a repository and return its output.
+
+    Args:
+        repo_dir: Directory to run git in
+        *args: Git subcommand and arguments
+
+    Returns:
+        str: Standard output of the command
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    # --no-optional-locks stops status from refreshing the index (and taking
+    # index.lock), which would wake the .git watcher for a read-only query
+    result = subprocess.run(
+        ["git", "--no-optional-locks", "-C", repo_dir, *args],
+        capture_output=True,
+        encoding="utf-8",
+        errors="replace",
+        check=True,
+    )
+    return result.stdout
+
+
+def _cached_git(repo_dir: str, fingerprint: Optional[tuple], *args: str) -> str:
+    """Run a git command, reusing output younger than _GIT_OUTPUT_TTL.
+
+    Lets several panels pointed at the same repository share one git
+    invocation per TTL window. Output is keyed by the repository
+    fingerprint too, so a change to the index or HEAD is never masked.
+
+    Args:
+        repo_dir: Repository work tree root
+        fingerprint: Current repository fingerprint (see GitPanel._repo_fingerprint)
+        *args: Git subcommand and arguments
+
+    Returns:
+        str: Standard output of the command
+    """
+    key = (repo_dir, fingerprint, args)
+    now = time.monotonic()
+    with _git_output_lock:
+        cached = _git_output_cache.get(key)
+    if cached is not None and now - cached[0] < _GIT_OUTPUT_TTL:
+        return cached[1]
+
+    output = _run_git(repo_dir, *args)
+    with _git_output_lock:
+        # Drop expired entries so old fingerprints don't accumulate
+        for old_key in [k for k, (t, _) in _git_output_cache.items() if now - t >= _GIT_OUTPUT_TTL]:
+            del _git_output_cache[old_key]
+        _git_output_cache[key] = (now, output)
+    return output
+
 
 class GitPanel(Container):
     """Widget displaying Git repository information."""
@@ -42,7 +175,7 @@ class GitPanel(Container):
     }
     """
 
-    git_content = reactive("")
+    git_content = reactive(Text)
 
     def __init__(self, config: Optional[GitConfig] = None, *args, **kwargs):
         """Initialize Git panel.
@@ -52,9 +185,28 @@ class GitPanel(Container):
         """
         super().__init__(*args, **kwargs)
         self.config = config or GitConfig()
-        self.repo: Optional[Repo] = None
+        self._snapshot_flags()
+        # Work tree root and .git directory, discovered on first refresh
+        self._repo_dir: Optional[str] = None
+        self._git_dir: Optional[str] = None
+        # When repository discovery last failed (monotonic), None if it hasn't
+        self._open_failed_at: Optional[float] = None
+        # Rendered commit list, reused while HEAD stays on the same commit
+        self._commits_key: Optional[tuple] = None
+        self._commits_text = _NO_COMMITS
         self.content_widget: Optional[Static] = None
         self.refresh_timer: Optional[Timer] = None
+        # Cheap change detector for the repository (see _repo_fingerprint)
+        self._fingerprint: Optional[tuple] = None
+        # When git status last ran (monotonic), and whether the latest
+        # refresh ran it; only real status comparisons drive the backoff
+        self._last_status_at = 0.0
+        self._status_ran = False
+        # Consecutive status checks without changes, used to back off polling
+        self._idle_streak = 0
+        # Watches the .git directory when watchdog is installed
+        self._observer = None
+        self._watch_refresh_pending = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -75,98 +227,194 @@ class GitPanel(Container):
     def on_unmount(self) -> None:
         """Clean up when widget is removed."""
         self._stop_refresh_timer()
+        self._stop_watching()
 
-    def watch_git_content(self, new_content: str) -> None:
+    def watch_git_content(self, new_content: Text) -> None:
         """Update content when git_content changes."""
         if self.content_widget:
             self.content_widget.update(new_content)
 
+    @work(thread=True, exclusive=True, group="git")
     def refresh_data(self) -> None:
-        """Refresh git data from repository."""
-        if not self.config.enabled:
-            return
+        """Refresh git data from repository on a worker thread.
 
-        if not GIT_AVAILABLE:
-            self.git_content = "[red]GitPython not available[/]"
-            return
+        Only the final ``git_content`` assignment runs on the UI thread.
+        """
+        self._status_ran = False
+        content = self._render_status()
+        # Identical output needs no reactive update (and no re-render)
+        if content == self.git_content:
+            content = None
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_refresh, content, self._status_ran)
 
-        try:
-            # Try to open repo from configured path or current directory
-            if self.repo is None:
-                repo_path = self._resolve_repository_path()
-                self.repo = Repo(repo_path, search_parent_directories=True)
+    def _apply_refresh(self, content: Optional[Text], status_ran: bool) -> None:
+        """Publish refreshed content and adapt the polling rate.
 
-            # Get current branch
-            branch = self.repo.active_branch.name
+        Args:
+            content: New panel text, or None if the content is unchanged
+            status_ran: Whether the refresh compared a fresh git status.
+                Fingerprint hits can't see working-tree edits, so they
+                don't count towards backing off.
+        """
+        if content is not None:
+            self.git_content = content
+        if status_ran:
+            self._record_activity(content is not None)
+        if WATCHDOG_AVAILABLE and self._observer is None and self._git_dir is not None:
+            self._start_watching()
 
-            # Get status counts (respecting config)
-            staged_count = 0
-            modified_count = 0
-            untracked_count = 0
+    def _render_status(self) -> Optional[Text]:
+        """Query git and render the panel content.
+
+        Builds styled ``Text`` directly, so Rich has no markup to parse and
+        commit subjects containing ``[`` are shown verbatim.
 
-            if self.config.show_staged:
-                staged_files = [item.a_path for item in self.repo.index.diff("HEAD")]
-                staged_count = len(staged_files)
+        Returns:
+            Optional[Text]: Rendered content, or None if the content is unchanged
+        """
+        if not self.config.enabled:
+            return None
 
-            if self.config.show_modified:
-                changed_files = [item.a_path for item in self.repo.index.diff(None)]
-                modified_count = len(changed_files)
+        if not _git_available():
+            return _GIT_NOT_FOUND
 
-            if self.config.show_untracked:
-                untracked_files = self.repo.untracked_files
-                untracked_count = len(untracked_files)
+        try:
+            # Find the repo from configured path or current directory
+            if self._repo_dir is None:
+                if (
+                    self._open_failed_at is not None
+                    and time.monotonic() - self._open_failed_at < _REPO_RETRY_SECONDS
+                ):
+                    return None
+                if not self._open_repository():
+                    self._open_failed_at = time.monotonic()
+                    return _NOT_A_REPO
+
+            # Skip the expensive status/log queries if nothing has changed
+            fingerprint = self._repo_fingerprint()
+            now = time.monotonic()
+            if (
+                fingerprint is not None
+                and fingerprint == self._fingerprint
+                and now - self._last_status_at < self.config.refresh_interval * _MAX_FINGERPRINT_HITS
+            ):
+                return None
+            self._fingerprint = None
+            self._last_status_at = now
+            self._status_ran = True
+
+            # Branch and status counts come from a single porcelain v2 call
+            show_staged, show_modified, show_untracked = self._flags
+            max_commits = self._max_commits
+            untracked_mode = "-uall" if show_untracked else "-uno"
+            status = _cached_git(
+                self._repo_dir,
+                fingerprint,
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                untracked_mode,
+            )
+
+            branch = "(unknown)"
+            head_oid = None
+            staged_count = 0
+            modified_count = 0
+            untracked_count = 0
+            for line in status.splitlines():
+                kind = line[:1]
+                if kind == "1" or kind == "2":
+                    # Ordinary or renamed entry: "1 XY ..." (X = index, Y = worktree)
+                    if line[2] != ".":
+                        staged_count += 1
+                    if line[3] != ".":
+                        modified_count += 1
+                elif kind == "u":
+                    modified_count += 1
+                elif kind == "?":
+                    untracked_count += 1
+                elif line.startswith("# branch.head "):
+                    branch = line[14:]
+                elif line.startswith("# branch.oid "):
+                    head_oid = line[13:]
+
+            # Only count what the config asks for
+            if not show_staged:
+                staged_count = 0
+            if not show_modified:
+                modified_count = 0
 
-            # Determine status
             total = staged_count + modified_count + untracked_count
-            if total == 0:
-                status_text = "[green]Clean[/]"
-            else:
-                status_text = f"[yellow]Modified ({total} files)[/]"
-
-            # Build file counts line (only show enabled counts)
-            file_counts = []
-            if self.config.show_staged:
-                file_counts.append(f"[dim]Staged:[/] {staged_count}")
-            if self.config.show_modified:
-                file_counts.append(f"[dim]Modified:[/] {modified_count}")
-            if self.config.show_untracked:
-                file_counts.append(f"[dim]Untracked:[/] {untracked_count}")
-            file_counts_text = "  ".join(file_counts) if file_counts else "[dim]No changes tracked[/]"
 
             # Get recent commits (use configured max_commits)
-            commits_text = ""
-            if self.config.max_commits > 0:
-                commits = list(self.repo.iter_commits(max_count=self.config.max_commits))
-                commit_lines = []
-                for commit in commits:
-                    short_hash = commit.hexsha[:7]
-                    message = commit.message.strip().split('\n')[0][:50]
-                    commit_lines.append(f"  • {short_hash} - {message}")
-                commits_text = "\n".join(commit_lines) if commit_lines else "  [dim]No commits[/]"
+            # Only re-run git log when HEAD has moved since the last read
+            if max_commits > 0:
+                commits_key = (head_oid, max_commits)
+                if commits_key != self._commits_key:
+                    commit_lines = ""
+                    if head_oid not in (None, "(initial)"):
+                        log = _cached_git(
+                            self._repo_dir,
+                            fingerprint,
+                            "log",
+                            f"--max-count={max_commits}",
+                            "--format=%h%x1f%<(50,trunc)%s%x1e",
+                        )
+                        # Records end with \x1e, fields are split by \x1f;
+                        # git truncates the subject and pads it to 50 columns
+                        fields = (record.strip("\n").partition("\x1f") for record in log.split("\x1e"))
+                        commit_lines = "\n".join(
+                            f"  • {short_hash} - {message.rstrip()}"
+                            for short_hash, sep, message in fields
+                            if sep
+                        )
+                    self._commits_text = Text(commit_lines) if commit_lines else _NO_COMMITS
+                    self._commits_key = commits_key
 
             # Build content
-            content_parts = [
-                f"[bold cyan]Branch:[/] {branch}",
-                f"[bold]Status:[/] {status_text}",
-                "",
-                file_counts_text,
+            content = Text()
+            content.append("Branch:", "bold cyan")
+            content.append(f" {branch}\n")
+            content.append("Status: ", "bold")
+            if total:
+                content.append(f"Modified ({total} files)", "yellow")
+            else:
+                content.append("Clean", "green")
+            content.append("\n\n")
+
+            # File counts line (only show enabled counts)
+            file_counts = [
+                (label, count)
+                for label, count, shown in (
+                    ("Staged:", staged_count, show_staged),
+                    ("Modified:", modified_count, show_modified),
+                    ("Untracked:", untracked_count, show_untracked),
+                )
+                if shown
             ]
+            if file_counts:
+                for index, (label, count) in enumerate(file_counts):
+                    if index:
+                        content.append("  ")
+                    content.append(label, "dim")
+                    content.append(f" {count}")
+            else:
+                content.append_text(_NO_CHANGES_TRACKED)
 
-            if self.config.max_commits > 0:
-                content_parts.extend([
-                    "",
-                    "[bold]Recent Commits:[/]",
-                    commits_text
-                ])
+            if max_commits > 0:
+                content.append("\n\n")
+                content.append("Recent Commits:", "bold")
+                content.append("\n")
+                content.append_text(self._commits_text)
 
-            self.git_content = "\n".join(content_parts)
+            self._fingerprint = fingerprint
+            return content
 
-        except InvalidGitRepositoryError:
-            self.git_content = "[yellow]Not a git repository[/]\n\n[dim]Navigate to a git repository to see status[/]"
-        except GitCommandError as e:
-            self.git_content = f"[red]Git error:[/]\n{str(e)}"
+        except subprocess.CalledProcessError as e:
+            return Text.assemble(("Git error:", "red"), "\n", (e.stderr or str(e)).strip())
         except Exception as e:
-            self.git_content = f"[red]Error:[/]\n{str(e)}"
+            return Text.assemble(("Error:", "red"), "\n", str(e))
 
     def update_config(self, new_config: GitConfig) -> None:
         """Update the git configuration and apply changes.
@@ -174,19 +422,33 @@ class GitPanel(Container):
         Args:
             new_config: New git configuration
         """
+        # Sections are dataclasses, so an unchanged reload compares equal
+        if new_config == self.config:
+            return
+
         old_interval = self.config.refresh_interval
         old_repo_path = self.config.repository_path
 
         self.config = new_config
+        self._snapshot_flags()
         self._apply_visibility()
 
         if not self.config.enabled:
             self._stop_refresh_timer()
+            self._stop_watching()
             return
 
         # If repository path changed, reload repo
         if old_repo_path != new_config.repository_path:
-            self.repo = None  # Force reload on next refresh
+            self._stop_watching()
+            self._repo_dir = None  # Force rediscovery on next refresh
+            self._git_dir = None
+            self._open_failed_at = None
+            self._commits_key = None
+
+        # Display options may have changed, so rebuild on the next refresh
+        self._fingerprint = None
+        self._idle_streak = 0
 
         # Restart refresh timer if needed or if it was stopped while disabled
         if (
@@ -197,15 +459,99 @@ class GitPanel(Container):
 
         self.refresh_data()
 
+    def _open_repository(self) -> bool:
+        """Locate the repository containing the configured path.
+
+        Runs ``git rev-parse`` once and caches the work tree root and the
+        absolute ``.git`` directory for later refreshes.
+
+        Returns:
+            bool: True if a repository was found, False otherwise
+        """
+        repo_path = self._resolve_repository_path()
+        try:
+            output = _run_git(
+                str(repo_path), "rev-parse", "--show-toplevel", "--absolute-git-dir"
+            )
+        except subprocess.CalledProcessError:
+            return False
+        self._repo_dir, self._git_dir = output.splitlines()[:2]
+        return True
+
+    def _repo_fingerprint(self) -> Optional[tuple]:
+        """Build a cheap fingerprint of the repository state.
+
+        Uses the mtime and size of ``.git/index``, the stat of ``HEAD`` and
+        the mtime of the ``logs/HEAD`` reflog. Together these change on
+        staging, commits, resets and branch switches. Everything is read
+        with ``os.stat``; opening files would wake the ``.git`` watcher.
+
+        Returns:
+            Fingerprint tuple, or None if the files could not be read
+        """
+        git_dir = self._git_dir
+        try:
+            index_stat = os.stat(os.path.join(git_dir, "index"))
+            # git rewrites HEAD via rename, so a switch gives a new inode
+            head_stat = os.stat(os.path.join(git_dir, "HEAD"))
+        except OSError:
+            return None
+        try:
+            # Appended on every HEAD move, even when the index is untouched
+            reflog_mtime = os.stat(os.path.join(git_dir, "logs", "HEAD")).st_mtime_ns
+        except OSError:
+            reflog_mtime = None  # Reflog disabled
+        return (
+            index_stat.st_mtime_ns,
+            index_stat.st_size,
+            head_stat.st_mtime_ns,
+            head_stat.st_size,
+            head_stat.st_ino,
+            reflog_mtime,
+        )
+
+    def _snapshot_flags(self) -> None:
+        """Copy the display options read on every refresh out of the config."""
+        cfg = self.config
+        self._flags = (cfg.show_staged, cfg.show_modified, cfg.show_untracked)
+        self._max_commits = cfg.max_commits
+
     def _apply_visibility(self) -> None:
         """Show or hide the panel based on configuration."""
         self.display = self.config.enabled
 
+    def _current_interval(self) -> float:
+        """Get the refresh interval, doubled for each idle refresh.
+
+        Returns:
+            float: Seconds between refreshes, capped at max_refresh_interval
+        """
+        base = self.config.refresh_interval
+        cap = max(base, self.config.max_refresh_interval)
+        return min(base * 2 ** self._idle_streak, cap)
+
+    def _record_activity(self, changed: bool) -> None:
+        """Back off polling while the repository is idle, reset on change.
+
+        Args:
+            changed: Whether the last git status check produced new content
+        """
+        old_interval = self._current_interval()
+        if changed:
+            self._idle_streak = 0
+        elif old_interval < self.config.max_refresh_interval:
+            self._idle_streak += 1
+        else:
+            return
+
+        if self.refresh_timer is not None and self._current_interval() != old_interval:
+            self._start_refresh_timer()
+
     def _start_refresh_timer(self) -> None:
         """Start or restart the refresh timer."""
         self._stop_refresh_timer()
         self.refresh_timer = self.set_interval(
-            self.config.refresh_interval,
+            self._current_interval(),
             self.refresh_data,
             name="git_refresh",
         )
@@ -216,6 +562,38 @@ class GitPanel(Container):
             self.refresh_timer.stop()
             self.refresh_timer = None
 
+    def _start_watching(self) -> None:
+        """Refresh on changes in the .git directory, if watchdog is available.
+
+        The refresh timer keeps running as a fallback for working-tree edits,
+        which don't touch ``.git``.
+        """
+        if not WATCHDOG_AVAILABLE:
+            return
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.schedule(_GitDirHandler(self), self._git_dir, recursive=False)
+            observer.start()
+        except OSError:
+            return  # e.g. inotify watch limit reached; keep polling only
+        self._observer = observer
+
+    def _schedule_watch_refresh(self) -> None:
+        """Refresh once the current burst of .git events has settled."""
+        self.set_timer(_WATCH_DEBOUNCE, self._watch_refresh)
+
+    def _watch_refresh(self) -> None:
+        """Run the refresh scheduled by _schedule_watch_refresh."""
+        self._watch_refresh_pending = False
+        self.refresh_data()
+
+    def _stop_watching(self) -> None:
+        """Stop watching the .git directory."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
     def _resolve_repository_path(self) -> Path:
         """Resolve the repository path from config or use current directory.
 
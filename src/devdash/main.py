@@ -3,371 +3,72 @@ Main entry point for devdash application.
 """
 
 import sys
-import argparse
-import re
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
-from textual.app import App, ComposeResult
-from textual.widgets import Header, Footer, Static
-from textual.containers import Container, Horizontal, Vertical
-from textual.binding import Binding
-
-from devdash.git_panel import GitPanel
-from devdash.system_panel import SystemPanel
-from devdash.tasks_panel import TasksPanel
-from devdash.timer_panel import TimerPanel
-from devdash.help_modal import HelpModal
-from devdash.config_editor_modal import ConfigEditorModal
 from devdash.config import (
-    load_config,
     DevDashConfig,
     ConfigLoadError,
     ConfigLoader,
     ConfigValidator,
     get_default_config,
-    KeybindingsConfig,
 )
 
 
-def _normalize_keybinding(value: str) -> str:
-    """Normalize user-provided keybinding strings for Textual.
+def create_devdash_app(config: DevDashConfig):
+    """Factory function to create a DevDashApp instance.
 
-    We lower-case multi-character bindings (e.g. Ctrl+A -> ctrl+a) while leaving
-    single characters untouched so Shift-style bindings (like `F`) keep meaning.
+    The Textual app (and every panel) is imported here rather than at module
+    level, so CLI-only paths like --generate-config don't pay for it.
     """
+    from devdash.app import DevDashApp
 
-    parts = [part.strip() for part in value.strip().split(",") if part.strip()]
-    normalized_parts = []
-    for part in parts:
-        if len(part) == 1:
-            normalized_parts.append(part)
-            continue
-        normalized = part.lower()
-        normalized = re.sub(r"(ctrl|shift|alt|meta|option|cmd|super)-", r"\1+", normalized)
-        normalized_parts.append(normalized)
-    return ",".join(normalized_parts)
-
-
-def _generate_keymap(config: KeybindingsConfig) -> dict[str, str]:
-    """Generate a textual keymap dictionary from keybindings configuration."""
-
-    return {
-        # General actions
-        "quit": _normalize_keybinding(config.quit),
-        "help": _normalize_keybinding(config.help),
-        "config": _normalize_keybinding(config.config),
-        "refresh": _normalize_keybinding(config.refresh),
-        # Task management
-        "add_task": _normalize_keybinding(config.add_task),
-        "edit_task": _normalize_keybinding(config.edit_task),
-        "toggle_task": _normalize_keybinding(config.toggle_task),
-        "delete_task": _normalize_keybinding(config.delete_task),
-        "quick_priority": _normalize_keybinding(config.quick_priority),
-        "filter_tasks": _normalize_keybinding(config.filter_tasks),
-        "sort_tasks": _normalize_keybinding(config.sort_tasks),
-        "export_tasks": _normalize_keybinding(config.export_tasks),
-        "filter_high": _normalize_keybinding(config.filter_high),
-        "filter_medium": _normalize_keybinding(config.filter_medium),
-        "filter_low": _normalize_keybinding(config.filter_low),
-        "clear_filters": _normalize_keybinding(config.clear_filters),
-        # Timer controls
-        "timer_focus": _normalize_keybinding(config.timer_focus),
-        "timer_break": _normalize_keybinding(config.timer_break),
-        "timer_stop": _normalize_keybinding(config.timer_stop),
-    }
+    return DevDashApp(config=config)
 
 
-def create_devdash_app(config: DevDashConfig):
-    """Factory function to create a DevDashApp instance."""
-    return DevDashApp(config=config)
+def __getattr__(name: str):
+    """Lazily expose DevDashApp for ``from devdash.main import DevDashApp``."""
+    if name == "DevDashApp":
+        from devdash.app import DevDashApp
 
+        return DevDashApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class DevDashApp(App):
-    """A terminal dashboard for developers."""
-
-    def __init__(self, config: Optional[DevDashConfig] = None):
-        """Initialize the DevDash application.
-
-        Args:
-            config: Configuration object. If None, loads from default locations.
-        """
-        super().__init__()
-        self.config = config or self._load_config_with_fallback()
-        self._apply_keybindings()
-
-    def _load_config_with_fallback(self) -> DevDashConfig:
-        """Load configuration with error handling.
-
-        Returns:
-            DevDashConfig: Loaded configuration or defaults if loading fails
-        """
-        try:
-            return load_config()
-        except ConfigLoadError as e:
-            # Log error but continue with defaults
-            print(f"Warning: {e}", file=sys.stderr)
-            print("Using default configuration.", file=sys.stderr)
-            from devdash.config import get_default_config
-            return get_default_config()
-
-    def _apply_keybindings(self) -> None:
-        """Apply the current configuration's keybindings to the app."""
-        if not self.config:
-            return
-        keymap = _generate_keymap(self.config.keybindings)
-        self.set_keymap(keymap)
-
-    CSS = """
-    Screen {
-        align: center middle;
-    }
-
-    #app-header {
-        background: $boost;
-        color: $text;
-        height: 3;
-        padding: 1;
-        dock: top;
-    }
-
-    #main-container {
-        width: 100%;
-        height: 100%;
-        padding: 1;
-    }
-
-    #top-panels {
-        height: 50%;
-        width: 100%;
-    }
-
-    #bottom-panels {
-        height: 50%;
-        width: 100%;
-    }
-
-    .panel-half {
-        width: 50%;
-    }
-    """
 
-    BINDINGS = [
-        Binding("q", "quit", "Quit", id="quit"),
-        Binding("?", "help", "Help", id="help"),
-        Binding("c", "config", "Config", id="config"),
-        Binding("r", "refresh", "Refresh", id="refresh"),
-        # Task management
-        Binding("a", "add_task", "Add Task", id="add_task"),
-        Binding("e", "edit_task", "Edit Task", id="edit_task"),
-        Binding("space", "toggle_task", "Toggle Done", id="toggle_task"),
-        Binding("d", "delete_task", "Delete Task", id="delete_task"),
-        Binding("p", "quick_priority", "Set Priority", id="quick_priority"),
-        Binding("f", "filter_tasks", "Filter", id="filter_tasks"),
-        Binding("s", "sort_tasks", "Sort", id="sort_tasks"),
-        Binding("x", "export_tasks", "Export", id="export_tasks"),
-        Binding("1", "filter_high", "High Priority", id="filter_high"),
-        Binding("2", "filter_medium", "Medium Priority", id="filter_medium"),
-        Binding("3", "filter_low", "Low Priority", id="filter_low"),
-        Binding("0", "clear_filters", "Clear Filters", id="clear_filters"),
-        # Timer (use Shift+key to avoid conflicts)
-        Binding("F", "timer_focus", "Focus", id="timer_focus"),
-        Binding("B", "timer_break", "Break", id="timer_break"),
-        Binding("S", "timer_stop", "Stop", id="timer_stop"),
-    ]
+# Printed by --validate-config when no config file exists
+_NO_CONFIG_FOUND_HELP = """
+Searched locations:
+  - ./.devdash.toml (current directory)
+  - ~/.config/devdash/config.toml
+  - ~/.devdash.toml
 
-    def compose(self) -> ComposeResult:
-        """Create child widgets for the app."""
-        # Header with current directory and time
-        yield Container(
-            Static(self._get_header_text(), id="header-text"),
-            id="app-header"
-        )
-
-        # Main container with panels
-        with Container(id="main-container"):
-            # Top row: Git (left) and System (right)
-            with Horizontal(id="top-panels"):
-                yield GitPanel(config=self.config.git, classes="panel-half")
-                yield SystemPanel(config=self.config.system, classes="panel-half")
-
-            # Bottom row: Tasks (left) and Timer (right)
-            with Horizontal(id="bottom-panels"):
-                yield TasksPanel(config=self.config.tasks, classes="panel-half")
-                yield TimerPanel(config=self.config.timer, classes="panel-half")
-
-        # Footer with keybindings
-        yield Footer()
-
-    def _get_header_text(self) -> str:
-        """Generate header text with directory and time."""
-        cwd = Path.cwd()
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return f"[bold]devdash[/] | [cyan]{cwd}[/] | [dim]{now}[/]"
-
-    def action_quit(self) -> None:
-        """Quit the application."""
-        self.exit()
-
-    def on_unmount(self) -> None:
-        """Clean up terminal state on exit."""
-        # Reset terminal modes to prevent cursor artifacts
-        import os
-        # Disable mouse tracking
-        os.system('printf "\\033[?1000l\\033[?1003l\\033[?1015l\\033[?1006l"')
-        # Reset terminal
-        os.system('tput reset 2>/dev/null || true')
-
-    def action_help(self) -> None:
-        """Show help popup with configured keybindings."""
-        self.push_screen(HelpModal(self.config))
-
-    def action_config(self) -> None:
-        """Show configuration editor."""
-        loader = ConfigLoader()
-        config_path = loader.find_config_file()
-
-        def handle_config_result(result) -> None:
-            """Handle config editor result."""
-            if result is True:
-                # Reload and apply the new configuration
-                self.reload_config()
-            elif result is False:
-                self.notify("Configuration changes cancelled", severity="information", timeout=1)
-
-        self.push_screen(
-            ConfigEditorModal(self.config, config_path),
-            handle_config_result
-        )
-
-    def reload_config(self) -> None:
-        """Reload configuration from file and apply to all panels."""
-        try:
-            # Reload config from file
-            new_config = load_config()
-
-            # Validate it
-            warnings = ConfigValidator.validate_config(new_config)
-            if warnings:
-                # Show warnings but continue
-                for warning in warnings:
-                    self.notify(f"Config warning: {warning}", severity="warning", timeout=3)
-
-            # Update app config
-            self.config = new_config
-            self._apply_keybindings()
-
-            # Update each panel with new config
-            git_panel = self.query_one(GitPanel)
-            git_panel.update_config(new_config.git)
-
-            system_panel = self.query_one(SystemPanel)
-            system_panel.update_config(new_config.system)
-
-            tasks_panel = self.query_one(TasksPanel)
-            tasks_panel.update_config(new_config.tasks)
-
-            timer_panel = self.query_one(TimerPanel)
-            timer_panel.update_config(new_config.timer)
-
-            # Show success notification
-            self.notify("Configuration reloaded successfully", severity="information", timeout=2)
-
-        except Exception as e:
-            # If reload fails, keep using old config
-            self.notify(f"Error reloading config: {e}", severity="error", timeout=5)
-
-    def action_refresh(self) -> None:
-        """Refresh all panels."""
-        # Will implement when panels have refresh methods
-        pass
-
-    # Task panel actions - delegate to TasksPanel
-    def action_add_task(self) -> None:
-        """Add a new task."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_add_task()
-
-    def action_edit_task(self) -> None:
-        """Edit selected task."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_edit_task()
-
-    def action_toggle_task(self) -> None:
-        """Toggle task completion."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_toggle_task()
-
-    def action_delete_task(self) -> None:
-        """Delete selected task."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_delete_task()
-
-    def action_quick_priority(self) -> None:
-        """Quick set priority."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_quick_priority()
-
-    def action_filter_tasks(self) -> None:
-        """Toggle task filter."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_filter_tasks()
-
-    def action_sort_tasks(self) -> None:
-        """Cycle sort order."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_sort_tasks()
-
-    def action_export_tasks(self) -> None:
-        """Export tasks to Markdown."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_export_tasks()
-
-    def action_filter_high(self) -> None:
-        """Filter high priority tasks."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_filter_high()
-
-    def action_filter_medium(self) -> None:
-        """Filter medium priority tasks."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_filter_medium()
-
-    def action_filter_low(self) -> None:
-        """Filter low priority tasks."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_filter_low()
-
-    def action_clear_filters(self) -> None:
-        """Clear all task filters."""
-        tasks_panel = self.query_one(TasksPanel)
-        tasks_panel.action_clear_filters()
-
-    # Timer panel actions - delegate to TimerPanel
-    def action_timer_focus(self) -> None:
-        """Start focus session."""
-        timer_panel = self.query_one(TimerPanel)
-        timer_panel.action_start_focus()
-
-    def action_timer_break(self) -> None:
-        """Start break session."""
-        timer_panel = self.query_one(TimerPanel)
-        timer_panel.action_start_break()
-
-    def action_timer_stop(self) -> None:
-        """Stop timer."""
-        timer_panel = self.query_one(TimerPanel)
-        timer_panel.action_stop_timer()
+Tip: Generate an example config with: devdash --generate-config > .devdash.toml
+"""
 
+# Usage examples shown at the end of --help
+_CLI_EPILOG = """
+Examples:
+  devdash                          # Run with default or discovered config
+  devdash --config my-config.toml  # Run with custom config file
+  devdash --validate-config        # Validate configuration file
+  devdash --show-config            # Display current configuration
+  devdash --generate-config > .devdash.toml  # Generate example config
+  devdash --version                # Show version and exit
 
-def generate_example_config() -> str:
-    """Generate an example configuration file content.
+--generate-config and --version are handled before option parsing and must
+be given on their own.
 
-    Returns:
-        String containing example TOML configuration
-    """
-    return """# DevDash Configuration File
+Config file locations (in priority order):
+  1. ./.devdash.toml (current directory)
+  2. ~/.config/devdash/config.toml
+  3. ~/.devdash.toml
+"""
+
+# Reported by --version
+_VERSION_STRING = "devdash 0.5.0"
+
+# Example configuration printed by --generate-config
+_EXAMPLE_CONFIG_TOML = """# DevDash Configuration File
 # See https://github.com/RainMaker033/devdash for full documentation
 
 [general]
@@ -378,6 +79,7 @@ update_header = true
 [git]
 enabled = true
 refresh_interval = 5  # seconds
+max_refresh_interval = 60  # seconds, polling slows down to this while the repo is idle
 max_commits = 3       # number of recent commits to display
 show_staged = true
 show_modified = true
@@ -472,33 +174,49 @@ timer_stop = "S"    # Shift+s
 """
 
 
+def generate_example_config() -> str:
+    """Generate an example configuration file content.
+
+    Returns:
+        String containing example TOML configuration
+    """
+    return _EXAMPLE_CONFIG_TOML
+
+
 def show_current_config(config: DevDashConfig) -> None:
     """Display the current configuration.
 
     Args:
         config: Configuration object to display
     """
-    print("Current DevDash Configuration:")
-    print("=" * 50)
-    print(f"\nGit Panel:")
-    print(f"  Enabled: {config.git.enabled}")
-    print(f"  Refresh interval: {config.git.refresh_interval}s")
-    print(f"  Max commits: {config.git.max_commits}")
-    print(f"\nSystem Panel:")
-    print(f"  Enabled: {config.system.enabled}")
-    print(f"  Refresh interval: {config.system.refresh_interval}s")
-    print(f"  CPU warning/critical: {config.system.cpu_warning_threshold}% / {config.system.cpu_critical_threshold}%")
-    print(f"  Progress bar width: {config.system.progress_bar_width}")
-    print(f"\nTasks Panel:")
-    print(f"  Enabled: {config.tasks.enabled}")
-    print(f"  File path: {config.tasks.file_path}")
-    print(f"  Default sort: {config.tasks.default_sort}")
-    print(f"  Max visible: {config.tasks.max_visible_tasks}")
-    print(f"\nTimer Panel:")
-    print(f"  Enabled: {config.timer.enabled}")
-    print(f"  Focus duration: {config.timer.focus_duration} minutes")
-    print(f"  Break duration: {config.timer.break_duration} minutes")
-    print(f"  Show progress bar: {config.timer.show_progress_bar}")
+    lines = [
+        "Current DevDash Configuration:",
+        "=" * 50,
+        "",
+        "Git Panel:",
+        f"  Enabled: {config.git.enabled}",
+        f"  Refresh interval: {config.git.refresh_interval}s",
+        f"  Max commits: {config.git.max_commits}",
+        "",
+        "System Panel:",
+        f"  Enabled: {config.system.enabled}",
+        f"  Refresh interval: {config.system.refresh_interval}s",
+        f"  CPU warning/critical: {config.system.cpu_warning_threshold}% / {config.system.cpu_critical_threshold}%",
+        f"  Progress bar width: {config.system.progress_bar_width}",
+        "",
+        "Tasks Panel:",
+        f"  Enabled: {config.tasks.enabled}",
+        f"  File path: {config.tasks.file_path}",
+        f"  Default sort: {config.tasks.default_sort}",
+        f"  Max visible: {config.tasks.max_visible_tasks}",
+        "",
+        "Timer Panel:",
+        f"  Enabled: {config.timer.enabled}",
+        f"  Focus duration: {config.timer.focus_duration} minutes",
+        f"  Break duration: {config.timer.break_duration} minutes",
+        f"  Show progress bar: {config.timer.show_progress_bar}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def validate_config_file(config_path: Optional[Path] = None) -> int:
@@ -519,63 +237,63 @@ def validate_config_file(config_path: Optional[Path] = None) -> int:
         file_to_validate = loader.find_config_file()
 
     if not file_to_validate:
-        print("No configuration file found.", file=sys.stderr)
-        print("\nSearched locations:")
-        print("  - ./.devdash.toml (current directory)")
-        print("  - ~/.config/devdash/config.toml")
-        print("  - ~/.devdash.toml")
-        print("\nTip: Generate an example config with: devdash --generate-config > .devdash.toml")
+        sys.stderr.write("No configuration file found.\n")
+        sys.stdout.write(_NO_CONFIG_FOUND_HELP)
         return 1
 
-    print(f"Validating: {file_to_validate}")
-    print("-" * 50)
+    out = [f"Validating: {file_to_validate}", "-" * 50]
 
     try:
         # Try to load the config
         config = loader.load_config(custom_path=file_to_validate)
-        print("✓ TOML syntax is valid")
+        out.append("✓ TOML syntax is valid")
 
         # Validate config values
         warnings = ConfigValidator.validate_config(config)
 
         if warnings:
-            print(f"\n⚠ Found {len(warnings)} warning(s):")
-            for warning in warnings:
-                print(f"  - {warning}")
-            print("\nConfiguration will use default values for invalid fields.")
-            return 1
+            out.append(f"\n⚠ Found {len(warnings)} warning(s):")
+            out.extend(f"  - {warning}" for warning in warnings)
+            out.append("\nConfiguration will use default values for invalid fields.")
+            exit_code = 1
         else:
-            print("✓ All configuration values are valid")
-            print("\nConfiguration is valid!")
-            return 0
+            out.append("✓ All configuration values are valid")
+            out.append("\nConfiguration is valid!")
+            exit_code = 0
 
     except ConfigLoadError as e:
-        print(f"✗ Configuration error:\n{e}", file=sys.stderr)
-        return 1
+        error = f"✗ Configuration error:\n{e}\n"
     except Exception as e:
-        print(f"✗ Unexpected error:\n{e}", file=sys.stderr)
-        return 1
+        error = f"✗ Unexpected error:\n{e}\n"
+    else:
+        sys.stdout.write("\n".join(out) + "\n")
+        return exit_code
+
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    sys.stderr.write(error)
+    return 1
 
 
 def cli():
     """Command-line interface entry point."""
+    # --generate-config and --version are only accepted on their own and are
+    # answered here, without building a parser
+    if len(sys.argv) == 2:
+        if sys.argv[1] == "--generate-config":
+            sys.stdout.write(_EXAMPLE_CONFIG_TOML)
+            sys.exit(0)
+        if sys.argv[1] == "--version":
+            sys.stdout.write(_VERSION_STRING + "\n")
+            sys.exit(0)
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="devdash",
         description="A terminal dashboard for developers - Git status, system metrics, tasks, and Pomodoro timer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  devdash                          # Run with default or discovered config
-  devdash --config my-config.toml  # Run with custom config file
-  devdash --validate-config        # Validate configuration file
-  devdash --show-config            # Display current configuration
-  devdash --generate-config > .devdash.toml  # Generate example config
-
-Config file locations (in priority order):
-  1. ./.devdash.toml (current directory)
-  2. ~/.config/devdash/config.toml
-  3. ~/.devdash.toml
-"""
+        epilog=_CLI_EPILOG,
     )
 
     parser.add_argument(
@@ -597,25 +315,8 @@ Config file locations (in priority order):
         help="Display current configuration and exit"
     )
 
-    parser.add_argument(
-        "--generate-config",
-        action="store_true",
-        help="Generate example configuration file to stdout"
-    )
-
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="devdash 0.5.0"
-    )
-
     args = parser.parse_args()
 
-    # Handle --generate-config
-    if args.generate_config:
-        print(generate_example_config())
-        sys.exit(0)
-
     # Handle --validate-config
     if args.validate_config:
         exit_code = validate_config_file(args.config)
@@ -630,20 +331,20 @@ Config file locations (in priority order):
         else:
             loader = ConfigLoader()
             config_path = loader.find_config_file()
-            config = load_config()
+            config = loader.load_config(custom_path=config_path) if config_path else get_default_config()
             config_source = str(config_path) if config_path else "defaults"
 
         # Validate config and show warnings
         warnings = ConfigValidator.validate_config(config)
         if warnings:
-            print("Configuration warnings:", file=sys.stderr)
-            for warning in warnings:
-                print(f"  - {warning}", file=sys.stderr)
-            print("", file=sys.stderr)
+            sys.stderr.write(
+                "Configuration warnings:\n"
+                + "".join(f"  - {warning}\n" for warning in warnings)
+                + "\n"
+            )
 
     except ConfigLoadError as e:
-        print(f"Error loading configuration: {e}", file=sys.stderr)
-        print("Using default configuration.", file=sys.stderr)
+        sys.stderr.write(f"Error loading configuration: {e}\nUsing default configuration.\n")
         config = get_default_config()
         config_source = "defaults (due to error)"
 
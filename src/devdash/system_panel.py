@@ -2,16 +2,21 @@
 System panel widget - displays system resource metrics
 """
 
+import os
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from datetime import timedelta
+from typing import NamedTuple, Optional
 
+from rich.text import Text
+from textual import work
 from textual.app import ComposeResult
 from textual.widgets import Static
 from textual.containers import Container
 from textual.reactive import reactive
 from textual.timer import Timer
+from textual.worker import get_current_worker
 
 try:
     import psutil
@@ -19,8 +24,116 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# psutil.getloadavg() is missing on old psutil releases for some platforms
+# (newer ones emulate it on Windows), so check once rather than per refresh
+HAS_LOADAVG = PSUTIL_AVAILABLE and hasattr(psutil, "getloadavg")
+
 from devdash.config.schema import SystemConfig
 
+# On Linux, CPU time counters are read straight from /proc/stat
+_PROC_STAT = "/proc/stat"
+_USE_PROC_STAT = sys.platform.startswith("linux")
+
+
+def _read_cpu_times() -> tuple[int, int]:
+    """Read aggregate CPU busy and total jiffies from /proc/stat.
+
+    Counts user, nice, system, idle, iowait, irq, softirq and steal time,
+    the same fields psutil sums; idle and iowait count as not busy.
+
+    Returns:
+        Tuple of (busy, total) jiffies since boot
+    """
+    with open(_PROC_STAT, "rb") as f:
+        fields = f.readline().split()
+    times = [int(value) for value in fields[1:9]]
+    total = sum(times)
+    return total - times[3] - times[4], total
+
+
+def _disk_usage(path: str) -> tuple[float, int, int]:
+    """Return disk usage for the filesystem containing path.
+
+    Uses os.statvfs directly where available, with the same arithmetic as
+    psutil.disk_usage (the percentage excludes root-reserved blocks), and
+    falls back to psutil elsewhere.
+
+    Args:
+        path: Any path on the filesystem
+
+    Returns:
+        Tuple of (percent used, used bytes, total bytes)
+    """
+    if not hasattr(os, "statvfs"):
+        usage = psutil.disk_usage(path)
+        return usage.percent, usage.used, usage.total
+
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    avail = st.f_bavail * st.f_frsize
+    usable = used + avail
+    percent = 100.0 * used / usable if usable else 0.0
+    return percent, used, total
+
+
+# Templates for the dynamic parts of the panel content
+_PERCENT_FMT = " %d%%"
+_USAGE_FMT = "\n         %s / %s"
+_LOAD_FMT = "%.2f, %.2f, %.2f"
+
+_LABEL_STYLE = "bold cyan"
+_PSUTIL_MISSING = Text("psutil not available", "red")
+_NO_METRICS = Text("No metrics enabled", "dim")
+
+# A sample younger than this fraction of the refresh interval is reused.
+# Timer ticks follow absolute deadlines, so a late tick is followed by an
+# early one; half an interval keeps that jitter from discarding a tick.
+_MIN_SAMPLE_FRACTION = 0.5
+
+
+class _Snapshot(NamedTuple):
+    """One round of psutil readings; fields for hidden metrics are None."""
+
+    cpu_percent: Optional[float]
+    ram_percent: Optional[float]
+    ram_used: Optional[int]
+    ram_total: Optional[int]
+    disk_percent: Optional[float]
+    disk_used: Optional[int]
+    disk_total: Optional[int]
+    load_avg: Optional[tuple[float, float, float]]
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def _format_bytes(bytes_val: int) -> str:
+    """Format bytes to human-readable format."""
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    unit = min((bytes_val.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_val / (1 << (unit * 10)):.1f} {_BYTE_UNITS[unit]}"
+
+
+# RAM and disk totals are constant in practice, so their text is memoized
+_format_total = lru_cache(maxsize=16)(_format_bytes)
+
+
+@lru_cache(maxsize=4)
+def _bar_table(width: int) -> tuple[tuple[str, str], ...]:
+    """Build the filled and empty cells of every progress bar of a given width.
+
+    Args:
+        width: Width of the progress bar in characters
+
+    Returns:
+        Tuple of width + 1 (filled, empty) string pairs, indexed by the
+        number of filled cells
+    """
+    return tuple(("█" * filled, "░" * (width - filled)) for filled in range(width + 1))
+
 
 class SystemPanel(Container):
     """Widget displaying system resource metrics."""
@@ -44,7 +157,7 @@ class SystemPanel(Container):
     }
     """
 
-    system_content = reactive("")
+    system_content = reactive(Text)
 
     def __init__(self, config: Optional[SystemConfig] = None, *args, **kwargs):
         """Initialize System panel.
@@ -57,12 +170,24 @@ class SystemPanel(Container):
         self.content_widget: Optional[Static] = None
         self.start_time = time.time()
         self.refresh_timer: Optional[Timer] = None
+        # Disk usage is reported for the directory devdash was started in
+        self._cwd_str = str(Path.cwd())
+        # Quantized readings behind the current system_content
+        self._last_rendered: Optional[tuple] = None
+        self._last_sample: Optional[_Snapshot] = None
+        self._last_sample_ts = 0.0
+        self._cpu_primed = False
+        self._use_proc_stat = _USE_PROC_STAT
+        self._prev_cpu_times: Optional[tuple[int, int]] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         yield Static("System Resources", classes="panel-title")
-        self.content_widget = Static("", classes="panel-content")
-        yield self.content_widget
+        # A disabled panel is hidden, so its content widget is only created
+        # once the panel gets enabled (see update_config)
+        if self.config.enabled:
+            self.content_widget = Static("", classes="panel-content")
+            yield self.content_widget
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -78,7 +203,7 @@ class SystemPanel(Container):
         """Clean up timers when widget is removed."""
         self._stop_refresh_timer()
 
-    def watch_system_content(self, new_content: str) -> None:
+    def watch_system_content(self, new_content: Text) -> None:
         """Update content when system_content changes."""
         if self.content_widget:
             self.content_widget.update(new_content)
@@ -89,7 +214,7 @@ class SystemPanel(Container):
         width: int = 10,
         warning_threshold: float = 60.0,
         critical_threshold: float = 80.0
-    ) -> tuple[str, str]:
+    ) -> tuple[Text, str]:
         """Create a visual progress bar with configurable thresholds.
 
         Args:
@@ -99,10 +224,9 @@ class SystemPanel(Container):
             critical_threshold: Percentage for critical (red) color
 
         Returns:
-            Tuple of (bar string, color name)
+            Tuple of (bar text, color name)
         """
-        filled = int((percentage / 100) * width)
-        empty = width - filled
+        filled = min(max(int((percentage / 100) * width), 0), width)
 
         # Color based on percentage and thresholds
         if percentage >= critical_threshold:
@@ -112,101 +236,203 @@ class SystemPanel(Container):
         else:
             color = "green"
 
-        bar = f"[{color}]{'█' * filled}[/]{'░' * empty}"
-        return bar, color
-
-    def _format_bytes(self, bytes_val: int) -> str:
-        """Format bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.1f} {unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.1f} PB"
+        filled_cells, empty_cells = _bar_table(width)[filled]
+        return Text.assemble((filled_cells, color), empty_cells), color
 
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime in human-readable format."""
-        td = timedelta(seconds=int(seconds))
-        hours, remainder = divmod(td.seconds, 3600)
+        days, remainder = divmod(int(seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
-        if td.days > 0:
-            return f"{td.days}d {hours}h {minutes}m"
+        if days > 0:
+            return f"{days}d {hours}h {minutes}m"
         elif hours > 0:
             return f"{hours}h {minutes}m"
         else:
             return f"{minutes}m {seconds}s"
 
+    @work(thread=True, exclusive=True, group="system")
     def refresh_data(self) -> None:
-        """Refresh system metrics."""
+        """Refresh system metrics on a worker thread.
+
+        psutil reads /proc (and statvfs for disk usage) off the UI thread;
+        only the final ``system_content`` assignment runs on the event loop.
+        """
+        content = self._render_metrics()
+        if content is not None and not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_content, content)
+
+    def _apply_content(self, content: Text) -> None:
+        """Publish refreshed content.
+
+        Args:
+            content: New panel text
+        """
+        self.system_content = content
+
+    def _render_metrics(self) -> Optional[Text]:
+        """Sample system metrics and render the panel content.
+
+        Builds styled ``Text`` directly, so Rich has no markup to parse on
+        each refresh.
+
+        Returns:
+            Optional[Text]: Rendered content, or None if the content is unchanged
+        """
         if not self.config.enabled:
-            return
+            return None
 
         if not PSUTIL_AVAILABLE:
-            self.system_content = "[red]psutil not available[/]"
-            return
+            return _PSUTIL_MISSING
 
         try:
+            snapshot = self._sample()
+            uptime = (
+                self._format_uptime(time.time() - self.start_time)
+                if self.config.show_uptime else None
+            )
+
+            # Percentages are shown (and drive bars and colors) in whole
+            # percent, so sub-percent jitter leaves the content unchanged
+            cpu_percent = None if snapshot.cpu_percent is None else round(snapshot.cpu_percent)
+            ram_percent = None if snapshot.ram_percent is None else round(snapshot.ram_percent)
+            disk_percent = None if snapshot.disk_percent is None else round(snapshot.disk_percent)
+            # Formatted once; the text doubles as the key for the load line
+            load_text = None if snapshot.load_avg is None else _LOAD_FMT % snapshot.load_avg
+            rendered_key = (
+                cpu_percent,
+                ram_percent,
+                disk_percent,
+                uptime,
+                load_text,
+            )
+            if rendered_key == self._last_rendered:
+                return None
+            self._last_rendered = rendered_key
+
             content_lines = []
 
-            # Get CPU usage (with interval for accuracy)
-            if self.config.show_cpu:
-                cpu_percent = psutil.cpu_percent(interval=0.1)
+            if cpu_percent is not None:
                 cpu_bar, _ = self._create_progress_bar(
                     cpu_percent,
                     width=self.config.progress_bar_width,
                     warning_threshold=self.config.cpu_warning_threshold,
                     critical_threshold=self.config.cpu_critical_threshold
                 )
-                content_lines.append(f"[bold cyan]CPU:[/]  {cpu_bar} {cpu_percent:.1f}%")
+                content_lines.append(Text.assemble(
+                    ("CPU:", _LABEL_STYLE), "  ", cpu_bar, _PERCENT_FMT % cpu_percent
+                ))
 
-            # Get RAM usage
-            if self.config.show_ram:
-                ram = psutil.virtual_memory()
+            if ram_percent is not None:
                 ram_bar, _ = self._create_progress_bar(
-                    ram.percent,
+                    ram_percent,
                     width=self.config.progress_bar_width,
                     warning_threshold=self.config.ram_warning_threshold,
                     critical_threshold=self.config.ram_critical_threshold
                 )
-                ram_used = self._format_bytes(ram.used)
-                ram_total = self._format_bytes(ram.total)
-                content_lines.append(f"[bold cyan]RAM:[/]  {ram_bar} {ram.percent:.1f}%")
-                content_lines.append(f"         {ram_used} / {ram_total}")
-
-            # Get disk usage for current directory
-            if self.config.show_disk:
-                disk = psutil.disk_usage(str(Path.cwd()))
+                content_lines.append(Text.assemble(
+                    ("RAM:", _LABEL_STYLE), "  ", ram_bar, _PERCENT_FMT % ram_percent,
+                    _USAGE_FMT % (_format_bytes(snapshot.ram_used), _format_total(snapshot.ram_total)),
+                ))
+
+            # Disk usage for current directory
+            if disk_percent is not None:
                 disk_bar, _ = self._create_progress_bar(
-                    disk.percent,
+                    disk_percent,
                     width=self.config.progress_bar_width,
                     warning_threshold=self.config.disk_warning_threshold,
                     critical_threshold=self.config.disk_critical_threshold
                 )
-                disk_used = self._format_bytes(disk.used)
-                disk_total = self._format_bytes(disk.total)
-                content_lines.append(f"[bold cyan]Disk:[/] {disk_bar} {disk.percent:.1f}%")
-                content_lines.append(f"         {disk_used} / {disk_total}")
+                content_lines.append(Text.assemble(
+                    ("Disk:", _LABEL_STYLE), " ", disk_bar, _PERCENT_FMT % disk_percent,
+                    _USAGE_FMT % (_format_bytes(snapshot.disk_used), _format_total(snapshot.disk_total)),
+                ))
 
             # Session uptime
-            if self.config.show_uptime:
+            if uptime is not None:
                 if content_lines:
-                    content_lines.append("")
-                uptime = self._format_uptime(time.time() - self.start_time)
-                content_lines.append(f"[dim]Session:[/] {uptime}")
+                    content_lines.append(Text())
+                content_lines.append(Text.assemble(("Session:", "dim"), " ", uptime))
 
             # Load average (if available on this platform)
-            if self.config.show_load_avg:
-                try:
-                    load_avg = psutil.getloadavg()
-                    load_text = f"[dim]Load:[/] {load_avg[0]:.2f}, {load_avg[1]:.2f}, {load_avg[2]:.2f}"
-                    content_lines.append(load_text)
-                except (AttributeError, OSError):
-                    # getloadavg not available on Windows
-                    pass
+            if load_text is not None:
+                content_lines.append(Text.assemble(("Load:", "dim"), " ", load_text))
 
-            self.system_content = "\n".join(content_lines) if content_lines else "[dim]No metrics enabled[/]"
+            return Text("\n").join(content_lines) if content_lines else _NO_METRICS
 
         except Exception as e:
-            self.system_content = f"[red]Error:[/]\n{str(e)}"
+            self._last_rendered = None
+            return Text.assemble(("Error:", "red"), "\n", str(e))
+
+    def _sample(self) -> _Snapshot:
+        """Read every enabled metric from psutil in one pass.
+
+        A snapshot taken less than ``_MIN_SAMPLE_FRACTION`` of the refresh
+        interval ago is returned as is, so back-to-back refreshes (e.g. from
+        a config reload) don't query psutil twice.
+
+        Returns:
+            _Snapshot: Current (or recent) readings
+        """
+        now = time.monotonic()
+        if (
+            self._last_sample is not None
+            and now - self._last_sample_ts < self.config.refresh_interval * _MIN_SAMPLE_FRACTION
+        ):
+            return self._last_sample
+
+        config = self.config
+        cpu_percent = None
+        if config.show_cpu:
+            if not self._cpu_primed:
+                # The first call only sets the baseline for later
+                # non-blocking calls, which report usage since the previous one
+                self._cpu_percent()
+                self._cpu_primed = True
+            cpu_percent = self._cpu_percent()
+
+        ram_percent = ram_used = ram_total = None
+        if config.show_ram:
+            ram = psutil.virtual_memory()
+            ram_percent, ram_used, ram_total = ram.percent, ram.used, ram.total
+
+        disk_percent = disk_used = disk_total = None
+        if config.show_disk:
+            disk_percent, disk_used, disk_total = _disk_usage(self._cwd_str)
+
+        load_avg = psutil.getloadavg() if config.show_load_avg and HAS_LOADAVG else None
+
+        self._last_sample = _Snapshot(
+            cpu_percent, ram_percent, ram_used, ram_total,
+            disk_percent, disk_used, disk_total, load_avg,
+        )
+        self._last_sample_ts = now
+        return self._last_sample
+
+    def _cpu_percent(self) -> float:
+        """Return CPU usage since the previous call, without blocking.
+
+        Reads /proc/stat directly on Linux and falls back to psutil elsewhere,
+        or if /proc/stat can't be read or parsed.
+
+        Returns:
+            float: CPU usage percentage (0-100)
+        """
+        if self._use_proc_stat:
+            try:
+                busy, total = _read_cpu_times()
+            except (OSError, ValueError, IndexError):
+                self._use_proc_stat = False
+                psutil.cpu_percent(interval=None)  # set psutil's baseline
+                return 0.0
+
+            prev = self._prev_cpu_times
+            self._prev_cpu_times = (busy, total)
+            if prev is None or total <= prev[1]:
+                return 0.0
+            return min(max(100.0 * (busy - prev[0]) / (total - prev[1]), 0.0), 100.0)
+
+        return psutil.cpu_percent(interval=None)
 
     def update_config(self, new_config: SystemConfig) -> None:
         """Update the system configuration and apply changes.
@@ -214,14 +440,26 @@ class SystemPanel(Container):
         Args:
             new_config: New system configuration
         """
+        # Sections are dataclasses, so an unchanged reload compares equal
+        if new_config == self.config:
+            return
+
         old_interval = self.config.refresh_interval
         self.config = new_config
+        self._last_rendered = None
+        # The enabled metrics may differ, so take a fresh sample
+        self._last_sample = None
+        self._cwd_str = str(Path.cwd())
         self._apply_visibility()
 
         if not self.config.enabled:
             self._stop_refresh_timer()
             return
 
+        if self.content_widget is None:
+            self.content_widget = Static(self.system_content, classes="panel-content")
+            self.mount(self.content_widget)
+
         if (
             self.refresh_timer is None
             or old_interval != new_config.refresh_interval
@@ -235,7 +473,12 @@ class SystemPanel(Container):
         self.display = self.config.enabled
 
     def _start_refresh_timer(self) -> None:
-        """Start the periodic refresh timer."""
+        """Start the periodic refresh timer.
+
+        Textual schedules each tick against ``start + n * interval`` on the
+        monotonic clock and skips missed ticks, so the cadence doesn't drift
+        and a stalled loop doesn't trigger a burst of catch-up refreshes.
+        """
         self._stop_refresh_timer()
         self.refresh_timer = self.set_interval(
             self.config.refresh_interval,
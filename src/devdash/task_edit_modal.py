@@ -2,6 +2,7 @@
 Task edit modal - comprehensive dialog for editing task details.
 """
 
+import re
 from datetime import datetime, date
 from typing import Optional, Callable
 
@@ -10,9 +11,21 @@ from textual.screen import ModalScreen
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Static, Input, Button, Select, Label
 from textual.message import Message
+from textual.binding import Binding
 
 from devdash.task_model import Task
 
+# Due dates are entered as YYYY-MM-DD (see the help text under the field)
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# QuickPriorityModal button id -> priority
+_PRIORITY_MAP = {
+    "high-btn": "high",
+    "medium-btn": "medium",
+    "low-btn": "low",
+    "none-btn": None,
+}
+
 
 class TaskEditModal(ModalScreen):
     """Modal dialog for editing task details."""
@@ -79,10 +92,10 @@ class TaskEditModal(ModalScreen):
     }
     """
 
-    BINDINGS = [
-        ("escape", "cancel", "Cancel"),
-        ("ctrl+s", "save", "Save"),
-    ]
+    BINDINGS = (
+        Binding("escape", "cancel", "Cancel"),
+        Binding("ctrl+s", "save", "Save"),
+    )
 
     class SaveTask(Message):
         """Message sent when task is saved."""
@@ -103,6 +116,12 @@ class TaskEditModal(ModalScreen):
         self.task_id = task_id or (task.id if task else 1)
         self.is_new = task is None
 
+        # Initial field values, resolved before compose builds the widgets
+        self._initial_text = task.text if task else ""
+        self._initial_priority = task.priority if task else None
+        self._initial_due_date = task.due_date if task else ""
+        self._initial_categories_str = ", ".join(task.categories) if task else ""
+
     def compose(self) -> ComposeResult:
         """Create edit dialog widgets."""
         title = "New Task" if self.is_new else "Edit Task"
@@ -115,7 +134,7 @@ class TaskEditModal(ModalScreen):
                 with Horizontal(classes="field-row"):
                     yield Label("Task:", classes="field-label")
                     yield Input(
-                        value=self.edit_task.text if self.edit_task else "",
+                        value=self._initial_text,
                         placeholder="Enter task description...",
                         id="task-text",
                         classes="field-input"
@@ -131,7 +150,7 @@ class TaskEditModal(ModalScreen):
                             ("🟡 Medium", "medium"),
                             ("🟢 Low", "low"),
                         ],
-                        value=self.edit_task.priority if self.edit_task else None,
+                        value=self._initial_priority,
                         id="task-priority",
                         classes="field-input"
                     )
@@ -140,7 +159,7 @@ class TaskEditModal(ModalScreen):
                 with Horizontal(classes="field-row"):
                     yield Label("Due Date:", classes="field-label")
                     yield Input(
-                        value=self.edit_task.due_date if self.edit_task else "",
+                        value=self._initial_due_date,
                         placeholder="YYYY-MM-DD (leave empty for none)",
                         id="task-due-date",
                         classes="field-input"
@@ -155,7 +174,7 @@ class TaskEditModal(ModalScreen):
                 with Horizontal(classes="field-row"):
                     yield Label("Categories:", classes="field-label")
                     yield Input(
-                        value=", ".join(self.edit_task.categories) if self.edit_task else "",
+                        value=self._initial_categories_str,
                         placeholder="work, personal, urgent (comma-separated)",
                         id="task-categories",
                         classes="category-input"
@@ -206,14 +225,17 @@ class TaskEditModal(ModalScreen):
         else:
             categories = []
 
-        # Validate due date if provided
+        # Validate due date if provided: shape first, then month/day ranges
         if due_date:
-            try:
-                datetime.fromisoformat(due_date)
-            except (ValueError, TypeError):
+            if not _DATE_RE.fullmatch(due_date):
                 # TODO: Show error message
                 due_date_input.focus()
                 return
+            try:
+                date.fromisoformat(due_date)
+            except ValueError:
+                due_date_input.focus()
+                return
 
         # Build task data
         task_data = {
@@ -270,13 +292,13 @@ class QuickPriorityModal(ModalScreen):
     }
     """
 
-    BINDINGS = [
-        ("escape", "cancel", "Cancel"),
-        ("1", "set_high", "High"),
-        ("2", "set_medium", "Medium"),
-        ("3", "set_low", "Low"),
-        ("0", "set_none", "None"),
-    ]
+    BINDINGS = (
+        Binding("escape", "cancel", "Cancel"),
+        Binding("1", "set_high", "High"),
+        Binding("2", "set_medium", "Medium"),
+        Binding("3", "set_low", "Low"),
+        Binding("0", "set_none", "None"),
+    )
 
     class SetPriority(Message):
         """Message sent when priority is selected."""
@@ -297,14 +319,8 @@ class QuickPriorityModal(ModalScreen):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        priority_map = {
-            "high-btn": "high",
-            "medium-btn": "medium",
-            "low-btn": "low",
-            "none-btn": None,
-        }
-        if event.button.id in priority_map:
-            self.post_message(self.SetPriority(priority_map[event.button.id]))
+        if event.button.id in _PRIORITY_MAP:
+            self.post_message(self.SetPriority(_PRIORITY_MAP[event.button.id]))
             self.dismiss()
 
     def action_set_high(self) -> None:
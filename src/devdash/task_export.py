@@ -2,19 +2,42 @@
 Task export functionality - export tasks to various formats.
 """
 
+import io
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from collections import defaultdict
+from typing import Any, Callable, List, Optional
 
-from devdash.task_model import Task
+from devdash.task_model import Task, _PRIORITY_RANK
+
+_PRIORITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+# Buffer size for streamed file exports
+_WRITE_BUFFER = 1 << 16
+
+
+# Sort keys shared by the exporters
+
+def _done_priority_key(task: Task) -> tuple:
+    """Open tasks first, then by priority."""
+    return task.done, _PRIORITY_RANK[task.priority]
+
+
+def _done_due_key(task: Task) -> tuple:
+    """Open tasks first, then soonest due date (no due date last)."""
+    return task.done, task.due_date or "9999-12-31"
+
+
+def _priority_done_key(task: Task) -> tuple:
+    """By priority, then open tasks first."""
+    return _PRIORITY_RANK[task.priority], task.done
 
 
 def export_to_markdown(
     tasks: List[Task],
     output_path: Optional[Path] = None,
     format_type: str = "grouped",
-    title: str = "DevDash Tasks"
+    title: str = "DevDash Tasks",
+    now: Optional[datetime] = None
 ) -> str:
     """
     Export tasks to Markdown format.
@@ -24,89 +47,123 @@ def export_to_markdown(
         output_path: Path to save file (None = return string only)
         format_type: "grouped" (by priority), "flat" (simple list), or "category" (by category)
         title: Document title
+        now: Export time for the header (defaults to the current time)
 
     Returns:
         Markdown content as string
     """
-    if format_type == "grouped":
-        content = _export_grouped_by_priority(tasks, title)
-    elif format_type == "category":
-        content = _export_grouped_by_category(tasks, title)
-    else:  # flat
-        content = _export_flat(tasks, title)
+    buf = io.StringIO()
+    _write_markdown(tasks, buf.write, format_type, title, now)
+    # Every line was written with a newline; the document has no trailing one
+    content = buf.getvalue()[:-1]
 
     # Write to file if path provided
     if output_path:
-        output_path.write_text(content)
+        with output_path.open("w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
 
     return content
 
 
-def _export_flat(tasks: List[Task], title: str) -> str:
+def export_to_markdown_to_file(
+    tasks: List[Task],
+    output_path: Path,
+    format_type: str = "grouped",
+    title: str = "DevDash Tasks",
+    now: Optional[datetime] = None
+) -> None:
+    """
+    Export tasks straight to a Markdown file without building the document string.
+
+    Args:
+        tasks: List of tasks to export
+        output_path: Path to save file
+        format_type: "grouped" (by priority), "flat" (simple list), or "category" (by category)
+        title: Document title
+        now: Export time for the header (defaults to the current time)
+    """
+    with output_path.open("w", encoding="utf-8", newline="\n", buffering=_WRITE_BUFFER) as f:
+        _write_markdown(tasks, f.write, format_type, title, now)
+
+
+def _write_markdown(
+    tasks: List[Task],
+    write: Callable[[str], Any],
+    format_type: str,
+    title: str,
+    now: Optional[datetime]
+) -> None:
+    """Dispatch to the exporter for format_type, writing through write."""
+    if now is None:
+        now = datetime.now()
+    if format_type == "grouped":
+        _export_grouped_by_priority(tasks, title, write, now)
+    elif format_type == "category":
+        _export_grouped_by_category(tasks, title, write, now)
+    else:  # flat
+        _export_flat(tasks, title, write, now)
+
+
+def _write_header(write, title: str, total: int, completed: int, now: datetime) -> None:
+    """Write the title, export timestamp and totals lines shared by all formats."""
+    exported = now.strftime('%Y-%m-%d %H:%M')
+    write(
+        f"# {title}\n\n"
+        f"*Exported: {exported}*\n\n"
+        f"Total tasks: {total} | Completed: {completed}\n\n"
+        "---\n\n"
+    )
+
+
+def _export_flat(tasks: List[Task], title: str, write: Callable[[str], Any], now: datetime) -> None:
     """Export tasks as flat list."""
-    lines = [
-        f"# {title}",
-        f"",
-        f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-        f"",
-        f"Total tasks: {len(tasks)} | Completed: {sum(1 for t in tasks if t.done)}",
-        f"",
-        "---",
-        f"",
-    ]
+    _write_header(write, title, len(tasks), sum(1 for t in tasks if t.done), now)
+    today = now.date()
 
     # Sort by completion, then priority
-    sorted_tasks = sorted(
-        tasks,
-        key=lambda t: (t.done, {"high": 0, "medium": 1, "low": 2, None: 3}.get(t.priority, 3))
-    )
+    sorted_tasks = sorted(tasks, key=_done_priority_key)
 
     for task in sorted_tasks:
         checkbox = "[x]" if task.done else "[ ]"
         priority_badge = ""
         if task.priority:
-            priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(task.priority, "")
+            priority_emoji = _PRIORITY_EMOJI.get(task.priority, "")
             priority_badge = f" **{priority_emoji} {task.priority.upper()}**"
 
         due_text = ""
         if task.due_date:
-            due_emoji = task.get_due_date_indicator()
+            due_emoji = task.get_due_date_indicator(today)
             due_text = f" {due_emoji} *Due: {task.due_date}*"
 
         categories_text = ""
         if task.categories:
             categories_text = " " + " ".join(f"`#{c}`" for c in task.categories)
 
-        lines.append(
-            f"- {checkbox} {task.text}{priority_badge}{due_text}{categories_text}"
-        )
-
-    return "\n".join(lines)
+        write(f"- {checkbox} {task.text}{priority_badge}{due_text}{categories_text}\n")
 
 
-def _export_grouped_by_priority(tasks: List[Task], title: str) -> str:
+def _export_grouped_by_priority(tasks: List[Task], title: str, write: Callable[[str], Any], now: datetime) -> None:
     """Export tasks grouped by priority."""
-    lines = [
-        f"# {title}",
-        f"",
-        f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-        f"",
-        f"Total tasks: {len(tasks)} | Completed: {sum(1 for t in tasks if t.done)}",
-        f"",
-        "---",
-        f"",
-    ]
-
-    # Group by priority
+    # Group by priority, counting completed tasks in the same pass
     priority_groups = {
         "high": [],
         "medium": [],
         "low": [],
         None: []
     }
+    done_by_priority = dict.fromkeys(priority_groups, 0)
+    total_done = 0
 
-    for task in tasks:
+    # Sort once by completion, then due date; the stable sort carries that
+    # order into every group, so the groups need no sorting of their own
+    for task in sorted(tasks, key=_done_due_key):
         priority_groups[task.priority].append(task)
+        if task.done:
+            done_by_priority[task.priority] += 1
+            total_done += 1
+
+    _write_header(write, title, len(tasks), total_done, now)
+    today = now.date()
 
     # Add each priority section
     priority_sections = [
@@ -120,144 +177,108 @@ def _export_grouped_by_priority(tasks: List[Task], title: str) -> str:
         if not group_tasks:
             continue
 
-        completed = sum(1 for t in group_tasks if t.done)
-        lines.append(f"## {section_title}")
-        lines.append(f"")
-        lines.append(f"*{len(group_tasks)} tasks ({completed} completed)*")
-        lines.append(f"")
-
-        # Sort by completion, then due date
-        sorted_group = sorted(
-            group_tasks,
-            key=lambda t: (t.done, t.due_date or "9999-12-31")
-        )
+        completed = done_by_priority[priority_key]
+        write(f"## {section_title}\n\n*{len(group_tasks)} tasks ({completed} completed)*\n\n")
 
-        for task in sorted_group:
+        for task in group_tasks:
             checkbox = "[x]" if task.done else "[ ]"
 
             due_text = ""
             if task.due_date:
-                due_emoji = task.get_due_date_indicator()
+                due_emoji = task.get_due_date_indicator(today)
                 due_text = f" {due_emoji} *Due: {task.due_date}*"
 
             categories_text = ""
             if task.categories:
                 categories_text = " " + " ".join(f"`#{c}`" for c in task.categories)
 
-            lines.append(
-                f"- {checkbox} {task.text}{due_text}{categories_text}"
-            )
+            write(f"- {checkbox} {task.text}{due_text}{categories_text}\n")
 
-        lines.append("")
+        write("\n")
 
-    return "\n".join(lines)
 
-
-def _export_grouped_by_category(tasks: List[Task], title: str) -> str:
+def _export_grouped_by_category(tasks: List[Task], title: str, write: Callable[[str], Any], now: datetime) -> None:
     """Export tasks grouped by category."""
-    lines = [
-        f"# {title}",
-        f"",
-        f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*",
-        f"",
-        f"Total tasks: {len(tasks)} | Completed: {sum(1 for t in tasks if t.done)}",
-        f"",
-        "---",
-        f"",
-    ]
-
-    # Group by categories
-    category_tasks = defaultdict(list)
+    # Group by categories, counting completed tasks in the same pass
+    category_tasks = {}
+    done_by_category = {}
     uncategorized = []
+    total_done = 0
 
-    for task in tasks:
+    # Sort once by priority, then completion; each category list and the
+    # uncategorized list inherit that order from the stable sort
+    for task in sorted(tasks, key=_priority_done_key):
+        if task.done:
+            total_done += 1
         if task.categories:
             for category in task.categories:
-                category_tasks[category].append(task)
+                group = category_tasks.get(category)
+                if group is None:
+                    category_tasks[category] = group = []
+                    done_by_category[category] = 0
+                group.append(task)
+                if task.done:
+                    done_by_category[category] += 1
         else:
             uncategorized.append(task)
 
-    # Sort categories alphabetically
-    sorted_categories = sorted(category_tasks.keys())
+    _write_header(write, title, len(tasks), total_done, now)
+    today = now.date()
 
-    # Add each category section
-    for category in sorted_categories:
+    # Add each category section, alphabetically
+    for category in sorted(category_tasks):
         group_tasks = category_tasks[category]
-        completed = sum(1 for t in group_tasks if t.done)
-
-        lines.append(f"## 📁 {category}")
-        lines.append(f"")
-        lines.append(f"*{len(group_tasks)} tasks ({completed} completed)*")
-        lines.append(f"")
-
-        # Sort by priority, then completion
-        sorted_group = sorted(
-            group_tasks,
-            key=lambda t: (
-                {"high": 0, "medium": 1, "low": 2, None: 3}.get(t.priority, 3),
-                t.done
-            )
-        )
-
-        for task in sorted_group:
+        completed = done_by_category[category]
+
+        write(f"## 📁 {category}\n\n*{len(group_tasks)} tasks ({completed} completed)*\n\n")
+
+        for task in group_tasks:
             checkbox = "[x]" if task.done else "[ ]"
 
             priority_badge = ""
             if task.priority:
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(task.priority, "")
+                priority_emoji = _PRIORITY_EMOJI.get(task.priority, "")
                 priority_badge = f" **{priority_emoji}**"
 
             due_text = ""
             if task.due_date:
-                due_emoji = task.get_due_date_indicator()
+                due_emoji = task.get_due_date_indicator(today)
                 due_text = f" {due_emoji} *{task.due_date}*"
 
-            lines.append(
-                f"- {checkbox} {task.text}{priority_badge}{due_text}"
-            )
+            write(f"- {checkbox} {task.text}{priority_badge}{due_text}\n")
 
-        lines.append("")
+        write("\n")
 
     # Add uncategorized section
     if uncategorized:
-        lines.append(f"## 📋 Uncategorized")
-        lines.append(f"")
-        lines.append(f"*{len(uncategorized)} tasks*")
-        lines.append(f"")
-
-        sorted_uncategorized = sorted(
-            uncategorized,
-            key=lambda t: (
-                {"high": 0, "medium": 1, "low": 2, None: 3}.get(t.priority, 3),
-                t.done
-            )
-        )
-
-        for task in sorted_uncategorized:
+        write(f"## 📋 Uncategorized\n\n*{len(uncategorized)} tasks*\n\n")
+
+        for task in uncategorized:
             checkbox = "[x]" if task.done else "[ ]"
 
             priority_badge = ""
             if task.priority:
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(task.priority, "")
+                priority_emoji = _PRIORITY_EMOJI.get(task.priority, "")
                 priority_badge = f" **{priority_emoji}**"
 
             due_text = ""
             if task.due_date:
-                due_emoji = task.get_due_date_indicator()
+                due_emoji = task.get_due_date_indicator(today)
                 due_text = f" {due_emoji} *{task.due_date}*"
 
-            lines.append(
-                f"- {checkbox} {task.text}{priority_badge}{due_text}"
-            )
+            write(f"- {checkbox} {task.text}{priority_badge}{due_text}\n")
 
-        lines.append("")
+        write("\n")
 
-    return "\n".join(lines)
 
+def get_export_filename(format_type: str = "grouped", now: Optional[datetime] = None) -> str:
+    """Generate a filename for export.
 
-def get_export_filename(format_type: str = "grouped") -> str:
-    """Generate a filename for export."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    Args:
+        format_type: Export format, included in the name
+        now: Timestamp for the name (defaults to the current time)
+    """
+    timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
     return f"devdash_tasks_{format_type}_{timestamp}.md"
 
 
@@ -280,9 +301,11 @@ def export_tasks_to_file(
     if directory is None:
         directory = Path.cwd()
 
-    filename = get_export_filename(format_type)
+    # One timestamp for both the filename and the header inside the file
+    now = datetime.now()
+    filename = get_export_filename(format_type, now)
     filepath = directory / filename
 
-    content = export_to_markdown(tasks, output_path=filepath, format_type=format_type)
+    export_to_markdown_to_file(tasks, filepath, format_type=format_type, now=now)
 
     return filepath
@@ -5,12 +5,40 @@ Supports priorities, due dates, categories, and backward compatibility
 with the original simple task format.
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
 
+# Sort rank per priority: High > Medium > Low > None. Covers every value
+# __post_init__ accepts, so sort keys index it directly
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2, None: 3}
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Keys every stored task must have
+_REQUIRED_FIELDS = frozenset({"id", "text", "done"})
+
+
+def _parse_due_date(value: str) -> date:
+    """Parse a due date string.
+
+    Plain "YYYY-MM-DD" goes through date.fromisoformat, which skips building
+    an intermediate datetime. Anything else falls back to
+    datetime.fromisoformat so older files with full timestamps still load.
+
+    Raises:
+        ValueError, TypeError: If value is not an ISO date or datetime
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value).date()
+
+
 class Priority(Enum):
     """Task priority levels."""
     HIGH = "high"
@@ -18,8 +46,14 @@ class Priority(Enum):
     LOW = "low"
 
 
-@dataclass
-class Task:
+class _TaskCaches:
+    """Slots for Task's derived-value caches, kept out of the dataclass fields."""
+
+    __slots__ = ("_due_cache", "_indicator_cache")
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Task(_TaskCaches):
     """Enhanced task with priority, due date, and categories."""
 
     id: int
@@ -37,10 +71,12 @@ class Task:
             if self.priority not in ["high", "medium", "low"]:
                 raise ValueError(f"Invalid priority: {self.priority}")
 
-        # Validate due_date format if present
+        # Validate due_date format if present, keeping the parse for the
+        # due date helpers below
+        due_cache = None
         if self.due_date is not None:
             try:
-                datetime.fromisoformat(self.due_date)
+                due_cache = (self.due_date, _parse_due_date(self.due_date))
             except (ValueError, TypeError):
                 raise ValueError(f"Invalid due_date format: {self.due_date}")
 
@@ -52,6 +88,12 @@ class Task:
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
 
+        # Caches for the due date helpers (slots on _TaskCaches, not dataclass
+        # fields, so they stay out of to_dict/equality). Each entry remembers the
+        # inputs it was computed from, so edits to due_date or done invalidate it.
+        self._due_cache: Optional[tuple] = due_cache  # (due_date, parsed date)
+        self._indicator_cache: Optional[tuple] = None  # ((due_date, done, today), indicator)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary for JSON serialization."""
         return asdict(self)
@@ -69,33 +111,49 @@ class Task:
             created_at=data.get('created_at')
         )
 
-    def is_overdue(self) -> bool:
-        """Check if task is overdue."""
-        if self.due_date is None or self.done:
-            return False
+    def _due_date_value(self) -> Optional[date]:
+        """Parse due_date, reusing the last result while due_date is unchanged."""
+        cached = self._due_cache
+        if cached is not None and cached[0] == self.due_date:
+            return cached[1]
         try:
-            due = datetime.fromisoformat(self.due_date).date()
-            return due < date.today()
+            parsed = _parse_due_date(self.due_date)
         except (ValueError, TypeError):
+            parsed = None
+        self._due_cache = (self.due_date, parsed)
+        return parsed
+
+    def is_overdue(self, today: Optional[date] = None) -> bool:
+        """Check if task is overdue.
+
+        Args:
+            today: Reference date; defaults to date.today(). Callers checking
+                many tasks can pass it once instead of reading the clock per task.
+        """
+        if self.due_date is None or self.done:
             return False
+        due = self._due_date_value()
+        return due is not None and due < (today or date.today())
+
+    def is_due_soon(self, days: int = 3, today: Optional[date] = None) -> bool:
+        """Check if task is due within specified days.
 
-    def is_due_soon(self, days: int = 3) -> bool:
-        """Check if task is due within specified days."""
+        Args:
+            days: Number of days ahead that counts as "soon"
+            today: Reference date; defaults to date.today()
+        """
         if self.due_date is None or self.done:
             return False
-        try:
-            due = datetime.fromisoformat(self.due_date).date()
-            today = date.today()
-            if due < today:
-                return False  # Overdue, not "due soon"
-            delta = (due - today).days
-            return delta <= days
-        except (ValueError, TypeError):
+        due = self._due_date_value()
+        if due is None:
             return False
+        # Overdue tasks are not "due soon"
+        return 0 <= (due - (today or date.today())).days <= days
 
     def has_category(self, category: str) -> bool:
         """Check if task has a specific category."""
-        return category.lower() in [c.lower() for c in self.categories]
+        needle = category.lower()
+        return any(c.lower() == needle for c in self.categories)
 
     def matches_priority(self, priority: Optional[str]) -> bool:
         """Check if task matches given priority (None matches no-priority tasks)."""
@@ -111,18 +169,33 @@ class Task:
             return "🟢"
         return ""
 
-    def get_due_date_indicator(self) -> str:
-        """Get visual indicator for due date status."""
+    def get_due_date_indicator(self, today: Optional[date] = None) -> str:
+        """Get visual indicator for due date status.
+
+        Args:
+            today: Reference date; defaults to date.today()
+        """
         if self.due_date is None:
             return ""
-        if self.is_overdue():
-            return "⚠️"
-        if self.is_due_soon():
-            return "📅"
-        return "📆"
-
 
-def migrate_legacy_task(old_task: Dict[str, Any]) -> Dict[str, Any]:
+        if today is None:
+            today = date.today()
+        key = (self.due_date, self.done, today)
+        cached = self._indicator_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if self.is_overdue(today):
+            indicator = "⚠️"
+        elif self.is_due_soon(today=today):
+            indicator = "📅"
+        else:
+            indicator = "📆"
+        self._indicator_cache = (key, indicator)
+        return indicator
+
+
+def migrate_legacy_task(old_task: Dict[str, Any], now_iso: Optional[str] = None) -> Dict[str, Any]:
     """
     Migrate legacy task format to new format.
 
@@ -131,7 +204,16 @@ def migrate_legacy_task(old_task: Dict[str, Any]) -> Dict[str, Any]:
 
     New format adds:
         priority, due_date, categories, created_at
+
+    Args:
+        old_task: Task dictionary in legacy or current format
+        now_iso: created_at to use when the task has none. Defaults to the
+            current time, read only when actually needed.
     """
+    if "created_at" in old_task:
+        created_at = old_task["created_at"]
+    else:
+        created_at = now_iso or datetime.now().isoformat()
     migrated = {
         "id": old_task.get("id", 0),
         "text": old_task.get("text", ""),
@@ -139,47 +221,74 @@ def migrate_legacy_task(old_task: Dict[str, Any]) -> Dict[str, Any]:
         "priority": old_task.get("priority"),  # None if not present
         "due_date": old_task.get("due_date"),  # None if not present
         "categories": old_task.get("categories", []),
-        "created_at": old_task.get("created_at", datetime.now().isoformat())
+        "created_at": created_at
     }
     return migrated
 
 
 def migrate_task_list(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Migrate a list of tasks from legacy to new format."""
-    return [migrate_legacy_task(task) for task in tasks]
+    # One clock read for the whole batch rather than one per task
+    now_iso = datetime.now().isoformat()
+    return [migrate_legacy_task(task, now_iso) for task in tasks]
 
 
 def validate_task_data(data: Dict[str, Any]) -> bool:
     """Validate task data structure."""
-    required_fields = ['id', 'text', 'done']
-    return all(field in data for field in required_fields)
+    return _REQUIRED_FIELDS <= data.keys()
+
+
+# Sort keys for sort_tasks, defined once rather than as per-call lambdas
+
+def _priority_created_key(task: Task) -> tuple:
+    """High > Medium > Low > None, then oldest first."""
+    return _PRIORITY_RANK[task.priority], task.created_at or ""
+
 
+def _due_date_key(task: Task) -> tuple:
+    """Soonest due date first, None at end."""
+    return task.due_date is None, task.due_date or "9999-12-31"
 
-def sort_tasks(tasks: List[Task], sort_by: str = "created") -> List[Task]:
+
+def _text_key(task: Task) -> str:
+    """Case-insensitive task text."""
+    return task.text.lower()
+
+
+def _created_key(task: Task) -> str:
+    """Creation timestamp (ISO strings sort chronologically)."""
+    return task.created_at or ""
+
+
+def sort_tasks(tasks: List[Task], sort_by: str = "created", in_place: bool = False) -> List[Task]:
     """
     Sort tasks by various criteria.
 
     Args:
         tasks: List of tasks to sort
         sort_by: Sort criteria - "created", "priority", "due_date", "text"
+        in_place: Sort and return tasks itself instead of a sorted copy.
+            Only for lists the caller owns.
 
     Returns:
         Sorted list of tasks
     """
     if sort_by == "priority":
-        # High > Medium > Low > None
-        priority_order = {"high": 0, "medium": 1, "low": 2, None: 3}
-        return sorted(tasks, key=lambda t: (priority_order.get(t.priority, 3), t.created_at or ""))
+        key = _priority_created_key
 
     elif sort_by == "due_date":
-        # Soonest due date first, None at end
-        return sorted(tasks, key=lambda t: (t.due_date is None, t.due_date or "9999-12-31"))
+        key = _due_date_key
 
     elif sort_by == "text":
-        return sorted(tasks, key=lambda t: t.text.lower())
+        key = _text_key
 
     else:  # "created" or default
-        return sorted(tasks, key=lambda t: t.created_at or "")
+        key = _created_key
+
+    if in_place:
+        tasks.sort(key=key)
+        return tasks
+    return sorted(tasks, key=key)
 
 
 def filter_tasks(
@@ -198,17 +307,16 @@ def filter_tasks(
         show_done: Whether to include completed tasks
 
     Returns:
-        Filtered list of tasks
+        Filtered list of tasks, or tasks itself when no filter applies
     """
-    filtered = tasks
-
-    if not show_done:
-        filtered = [t for t in filtered if not t.done]
-
-    if priority is not None:
-        filtered = [t for t in filtered if t.matches_priority(priority)]
-
-    if category is not None:
-        filtered = [t for t in filtered if t.has_category(category)]
-
-    return filtered
+    if show_done and priority is None and category is None:
+        return tasks
+
+    # One pass with every predicate applied, rather than a list per filter
+    needle = category.lower() if category is not None else None
+    return [
+        t for t in tasks
+        if (show_done or not t.done)
+        and (priority is None or t.priority == priority)
+        and (needle is None or any(c.lower() == needle for c in t.categories))
+    ]
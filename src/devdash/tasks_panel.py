@@ -3,19 +3,52 @@ Tasks panel widget - displays and manages TODO tasks with enhanced features.
 """
 
 import json
+import os
+from datetime import date
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from textual.app import ComposeResult
 from textual.widgets import Static
 from textual.containers import Container
 from textual.reactive import reactive
+from textual.timer import Timer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from devdash.task_model import Task, migrate_task_list, sort_tasks, filter_tasks
 from devdash.task_edit_modal import TaskEditModal, QuickPriorityModal
 from devdash.task_export import export_tasks_to_file
 from devdash.config.schema import TasksConfig
 
+# Delay used to coalesce bursts of actions (held arrow keys, quick filter
+# changes) into a single re-render
+_REFRESH_DELAY = 0.05
+
+# Delay before writing the task file, so a run of edits costs one write
+_SAVE_DELAY = 0.5
+
+# Key hints shown under the task list
+_FOOTER = "\n\n[dim]a:add e:edit space:toggle d:delete p:priority f:filter[/]"
+
+
+def _dumps(obj) -> bytes:
+    """Serialize tasks to indented UTF-8 JSON, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, via orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class TasksPanel(Container):
     """Widget displaying and managing tasks with priorities, due dates, and categories."""
@@ -59,6 +92,18 @@ class TasksPanel(Container):
         self.content_widget: Optional[Static] = None
         self.tasks: List[Task] = []
         self.selected_index: int = 0
+        # Next id to hand out; kept ahead of every loaded or added task
+        self._next_id: int = 1
+        # Bumped whenever self.tasks changes; keys the filtered/sorted view cache
+        self._tasks_version: int = 0
+        self._view_cache: Optional[tuple] = None  # (key, filtered and sorted tasks)
+        self._refresh_pending: bool = False
+        # Row markup from the last render: id(task) -> (task, today, markup).
+        # Holding the task guards against id() reuse; in-place edits pop entries
+        self._row_cache: Dict[int, tuple] = {}
+        # Pending deferred save, and the bytes last written to tasks_file
+        self._save_timer: Optional[Timer] = None
+        self._last_saved: Optional[bytes] = None
 
         # Use configured tasks file path (support absolute or relative)
         file_path = Path(self.config.file_path)
@@ -84,6 +129,10 @@ class TasksPanel(Container):
         self.load_tasks()
         self.refresh_display()
 
+    def on_unmount(self) -> None:
+        """Write any pending task changes before the panel goes away."""
+        self._flush_save()
+
     def watch_tasks_content(self, new_content: str) -> None:
         """Update content when tasks_content changes."""
         if self.content_widget:
@@ -101,30 +150,87 @@ class TasksPanel(Container):
         """Load tasks from JSON file with migration support."""
         try:
             if self.tasks_file.exists():
-                with open(self.tasks_file, 'r') as f:
-                    task_dicts = json.load(f)
+                task_dicts = _loads(self.tasks_file.read_bytes())
 
                 # Migrate legacy tasks
                 migrated = migrate_task_list(task_dicts)
 
                 # Convert to Task objects
                 self.tasks = [Task.from_dict(t) for t in migrated]
+
+                # Legacy entries without an id migrate to id 0; number them
+                # after the highest existing id in a single pass
+                max_id = max((t.id for t in self.tasks), default=0)
+                for task in self.tasks:
+                    if not task.id:
+                        max_id += 1
+                        task.id = max_id
+                self._next_id = max_id + 1
             else:
                 self.tasks = []
+                self._next_id = 1
         except (json.JSONDecodeError, IOError):
             self.tasks = []
+            self._next_id = 1
+        self._last_saved = None
+        self._tasks_changed()
+
+    def _tasks_changed(self) -> None:
+        """Invalidate the cached task view after self.tasks is modified."""
+        self._tasks_version += 1
 
     def save_tasks(self) -> None:
-        """Save tasks to JSON file."""
+        """Save tasks to JSON file.
+
+        Skips the write when the serialized tasks match what was last saved,
+        and writes through a temporary file so a crash mid-write cannot leave
+        a truncated task file behind.
+        """
+        payload = _dumps([task.to_dict() for task in self.tasks])
+        if payload == self._last_saved:
+            return
+        tmp_path = self.tasks_file.with_name(self.tasks_file.name + ".tmp")
         try:
-            task_dicts = [task.to_dict() for task in self.tasks]
-            with open(self.tasks_file, 'w') as f:
-                json.dump(task_dicts, f, indent=2)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.tasks_file)
+            self._last_saved = payload
         except IOError:
-            pass
+            # Don't leave a half-written temp file next to the task file
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _schedule_save(self) -> None:
+        """Save shortly, folding further changes into the same write."""
+        if self._save_timer is None:
+            self._save_timer = self.set_timer(_SAVE_DELAY, self._flush_save)
+
+    def _flush_save(self) -> None:
+        """Run a save scheduled by _schedule_save now, if one is pending."""
+        if self._save_timer is None:
+            return
+        self._save_timer.stop()
+        self._save_timer = None
+        self.save_tasks()
 
     def get_filtered_sorted_tasks(self) -> List[Task]:
-        """Get tasks after applying filters and sorting."""
+        """Get tasks after applying filters and sorting.
+
+        The result is cached until the tasks or the filter/sort state change,
+        so callers must not modify the returned list.
+        """
+        key = (
+            self._tasks_version,
+            self.current_filter_priority,
+            self.current_filter_category,
+            self.show_done,
+            self.sort_by,
+        )
+        cached = self._view_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         # Apply filters
         filtered = filter_tasks(
             self.tasks,
@@ -133,11 +239,25 @@ class TasksPanel(Container):
             show_done=self.show_done
         )
 
-        # Apply sorting
-        sorted_tasks = sort_tasks(filtered, sort_by=self.sort_by)
+        # Apply sorting. filter_tasks hands back self.tasks itself when nothing
+        # is filtered out; any other result is a fresh list we can sort in place
+        sorted_tasks = sort_tasks(filtered, sort_by=self.sort_by, in_place=filtered is not self.tasks)
 
+        self._view_cache = (key, sorted_tasks)
         return sorted_tasks
 
+    def _schedule_refresh(self) -> None:
+        """Re-render shortly, folding any further requests into the same refresh."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.set_timer(_REFRESH_DELAY, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Run a refresh scheduled by _schedule_refresh."""
+        self._refresh_pending = False
+        self.refresh_display()
+
     def refresh_display(self) -> None:
         """Refresh the tasks display with enhanced formatting."""
         if not self.config.enabled:
@@ -152,7 +272,8 @@ class TasksPanel(Container):
                 self.tasks_content = "[dim]No tasks yet.[/]\n\n[dim]Press 'a' to add a task[/]"
             return
 
-        lines = []
+        lines: List[str] = []
+        append = lines.append
 
         # Show filter/sort status
         status_parts = []
@@ -164,59 +285,84 @@ class TasksPanel(Container):
             status_parts.append(f"Sort: {self.sort_by}")
 
         if status_parts:
-            lines.append(f"[dim]({', '.join(status_parts)})[/]\n")
-
-        lines.append("[bold]TODO List:[/]\n")
-
-        for i, task in enumerate(display_tasks):
-            # Find original index in full task list
-            original_idx = self.tasks.index(task) if task in self.tasks else -1
+            append(f"[dim]({', '.join(status_parts)})[/]\n")
+
+        append("[bold]TODO List:[/]\n")
+
+        today = date.today()
+        # Match the selected task by identity instead of looking up each row's
+        # index in self.tasks, which made rendering quadratic
+        selected = self.tasks[self.selected_index] if 0 <= self.selected_index < len(self.tasks) else None
+
+        # Only format max_visible_tasks rows, in a window around the selection
+        total = len(display_tasks)
+        window = self.config.max_visible_tasks
+        start, end = 0, total
+        if total > window:
+            selected_pos = next((i for i, t in enumerate(display_tasks) if t is selected), 0)
+            start = min(max(0, selected_pos - window // 2), total - window)
+            end = start + window
+            if start:
+                append(f"[dim]… {start} more above[/]")
+
+        # Reuse row markup from the previous render; only rows still on screen
+        # are carried over, so deleted tasks drop out of the cache
+        row_cache = self._row_cache
+        rendered = {}
+        for task in display_tasks[start:end]:
+            cached = row_cache.get(id(task))
+            if cached is not None and cached[0] is task and cached[1] == today:
+                line = cached[2]
+            else:
+                line = self._format_row(task, today)
+            rendered[id(task)] = (task, today, line)
 
-            # Checkbox
-            checkbox = "[green]✓[/]" if task.done else "[ ]"
+            # Highlight selected task
+            if task is selected:
+                line = f"[reverse]{line}[/]"
 
-            # Priority emoji
-            priority_emoji = task.get_priority_emoji()
+            append(line)
 
-            # Due date indicator
-            due_indicator = task.get_due_date_indicator()
+        if end < total:
+            append(f"[dim]… {total - end} more below[/]")
 
-            # Task text (truncate if needed)
-            text = task.text
-            if len(text) > 40:
-                text = text[:37] + "..."
+        self._row_cache = rendered
+        self.tasks_content = "\n".join(lines) + _FOOTER
 
-            # Categories
-            if task.categories:
-                categories_str = " " + " ".join(f"[dim]#{c}[/]" for c in task.categories[:2])
-            else:
-                categories_str = ""
+    def _format_row(self, task: Task, today: date) -> str:
+        """Build the markup for one task row, without the selection highlight."""
+        # Checkbox
+        checkbox = "[green]✓[/]" if task.done else "[ ]"
 
-            # Due date text
-            due_text = ""
-            if task.due_date:
-                due_text = f" [cyan]{task.due_date}[/]"
+        # Priority emoji
+        priority_emoji = task.get_priority_emoji()
 
-            # Build line
-            line = f"{checkbox} {priority_emoji}{text}{categories_str}{due_indicator}{due_text}"
+        # Due date indicator
+        due_indicator = task.get_due_date_indicator(today)
 
-            # Highlight selected task
-            if original_idx == self.selected_index:
-                line = f"[reverse]{line}[/]"
+        # Task text (truncate if needed)
+        text = task.text
+        if len(text) > 40:
+            text = text[:37] + "..."
 
-            lines.append(line)
+        # Categories
+        if task.categories:
+            categories_str = " " + " ".join(f"[dim]#{c}[/]" for c in task.categories[:2])
+        else:
+            categories_str = ""
 
-        lines.append("")
-        lines.append("[dim]a:add e:edit space:toggle d:delete p:priority f:filter[/]")
+        # Due date text
+        due_text = ""
+        if task.due_date:
+            due_text = f" [cyan]{task.due_date}[/]"
 
-        self.tasks_content = "\n".join(lines)
+        return f"{checkbox} {priority_emoji}{text}{categories_str}{due_indicator}{due_text}"
 
     def action_add_task(self) -> None:
         """Open task editor modal to add a new task."""
         if not self._interactions_enabled():
             return
-        next_id = max([t.id for t in self.tasks], default=0) + 1
-        self.app.push_screen(TaskEditModal(task_id=next_id), self.handle_edit_save)
+        self.app.push_screen(TaskEditModal(task_id=self._next_id), self.handle_edit_save)
 
     def action_edit_task(self) -> None:
         """Open full edit dialog for selected task."""
@@ -227,8 +373,7 @@ class TasksPanel(Container):
             self.app.push_screen(TaskEditModal(task=task), self.handle_edit_save)
         else:
             # No task selected, create new
-            next_id = max([t.id for t in self.tasks], default=0) + 1
-            self.app.push_screen(TaskEditModal(task_id=next_id), self.handle_edit_save)
+            self.app.push_screen(TaskEditModal(task_id=self._next_id), self.handle_edit_save)
 
     def handle_edit_save(self, message: TaskEditModal.SaveTask) -> None:
         """Handle task save from edit modal."""
@@ -247,9 +392,11 @@ class TasksPanel(Container):
             # Add new task
             self.tasks.append(task)
             self.selected_index = len(self.tasks) - 1
+            self._next_id = max(self._next_id, task.id + 1)
 
-        self.save_tasks()
-        self.refresh_display()
+        self._tasks_changed()
+        self._schedule_save()
+        self._schedule_refresh()
 
     def action_quick_priority(self) -> None:
         """Open quick priority selection modal."""
@@ -263,18 +410,24 @@ class TasksPanel(Container):
         if not self.config.enabled or message is None:
             return  # User cancelled or panel disabled
         if 0 <= self.selected_index < len(self.tasks):
-            self.tasks[self.selected_index].priority = message.priority
-            self.save_tasks()
-            self.refresh_display()
+            task = self.tasks[self.selected_index]
+            task.priority = message.priority
+            self._row_cache.pop(id(task), None)
+            self._tasks_changed()
+            self._schedule_save()
+            self._schedule_refresh()
 
     def action_toggle_task(self) -> None:
         """Toggle the selected task's done status."""
         if not self._interactions_enabled():
             return
         if 0 <= self.selected_index < len(self.tasks):
-            self.tasks[self.selected_index].done = not self.tasks[self.selected_index].done
-            self.save_tasks()
-            self.refresh_display()
+            task = self.tasks[self.selected_index]
+            task.done = not task.done
+            self._row_cache.pop(id(task), None)
+            self._tasks_changed()
+            self._schedule_save()
+            self._schedule_refresh()
 
     def action_delete_task(self) -> None:
         """Delete the selected task."""
@@ -284,8 +437,9 @@ class TasksPanel(Container):
             self.tasks.pop(self.selected_index)
             if self.selected_index >= len(self.tasks) and self.tasks:
                 self.selected_index = len(self.tasks) - 1
-            self.save_tasks()
-            self.refresh_display()
+            self._tasks_changed()
+            self._schedule_save()
+            self._schedule_refresh()
 
     def action_move_up(self) -> None:
         """Move selection up."""
@@ -293,7 +447,7 @@ class TasksPanel(Container):
             return
         if self.selected_index > 0:
             self.selected_index -= 1
-            self.refresh_display()
+            self._schedule_refresh()
 
     def action_move_down(self) -> None:
         """Move selection down."""
@@ -301,35 +455,35 @@ class TasksPanel(Container):
             return
         if self.selected_index < len(self.tasks) - 1:
             self.selected_index += 1
-            self.refresh_display()
+            self._schedule_refresh()
 
     def action_filter_tasks(self) -> None:
         """Toggle show/hide completed tasks."""
         if not self._interactions_enabled():
             return
         self.show_done = not self.show_done
-        self.refresh_display()
+        self._schedule_refresh()
 
     def action_filter_high(self) -> None:
         """Filter to show only high priority tasks."""
         if not self._interactions_enabled():
             return
         self.current_filter_priority = "high"
-        self.refresh_display()
+        self._schedule_refresh()
 
     def action_filter_medium(self) -> None:
         """Filter to show only medium priority tasks."""
         if not self._interactions_enabled():
             return
         self.current_filter_priority = "medium"
-        self.refresh_display()
+        self._schedule_refresh()
 
     def action_filter_low(self) -> None:
         """Filter to show only low priority tasks."""
         if not self._interactions_enabled():
             return
         self.current_filter_priority = "low"
-        self.refresh_display()
+        self._schedule_refresh()
 
     def action_clear_filters(self) -> None:
         """Clear all filters."""
@@ -338,7 +492,7 @@ class TasksPanel(Container):
         self.current_filter_priority = None
         self.current_filter_category = None
         self.show_done = True
-        self.refresh_display()
+        self._schedule_refresh()
 
     def update_config(self, new_config: TasksConfig) -> None:
         """Update the tasks configuration and apply changes.
@@ -346,6 +500,10 @@ class TasksPanel(Container):
         Args:
             new_config: New tasks configuration
         """
+        # Sections are dataclasses, so an unchanged reload compares equal
+        if new_config == self.config:
+            return
+
         old_path = self.config.file_path
         was_enabled = self.config.enabled
         self.config = new_config
@@ -356,6 +514,8 @@ class TasksPanel(Container):
         new_tasks_file = file_path if file_path.is_absolute() else Path.cwd() / file_path
 
         if old_path != self.config.file_path:
+            # Pending changes belong to the old file
+            self._flush_save()
             self.tasks_file = new_tasks_file
             # Reload tasks from new location
             self.load_tasks()
@@ -383,7 +543,7 @@ class TasksPanel(Container):
         sort_options = ["created", "priority", "due_date", "text"]
         current_idx = sort_options.index(self.sort_by)
         self.sort_by = sort_options[(current_idx + 1) % len(sort_options)]
-        self.refresh_display()
+        self._schedule_refresh()
 
     def action_export_tasks(self) -> None:
         """Export tasks to Markdown."""
@@ -212,6 +212,10 @@ Press 'Shift+B' for break ({self.config.break_duration}min)[/]
         Args:
             new_config: New timer configuration
         """
+        # Sections are dataclasses, so an unchanged reload compares equal
+        if new_config == self.config:
+            return
+
         was_enabled = self.config.enabled
         self.config = new_config
         self._apply_visibility()
@@ -29,6 +29,7 @@ class TestSchemaDefaults:
         config = GitConfig()
         assert config.enabled is True
         assert config.refresh_interval == 5
+        assert config.max_refresh_interval == 60
         assert config.max_commits == 3
         assert config.show_staged is True
         assert config.show_modified is True
@@ -35,6 +35,13 @@ class TestGitConfigValidation:
         assert len(warnings) > 0
         assert "very large" in warnings[0]
 
+    def test_validate_git_max_refresh_interval_below_base(self):
+        """Test validation warns when the backoff cap is below the base interval."""
+        config = GitConfig(refresh_interval=30, max_refresh_interval=10)
+        warnings = ConfigValidator.validate_git(config)
+        assert len(warnings) == 1
+        assert "max_refresh_interval" in warnings[0]
+
     def test_validate_git_invalid_max_commits_negative(self):
         """Test validation catches negative max_commits."""
         config = GitConfig(max_commits=-1)
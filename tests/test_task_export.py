@@ -2,11 +2,12 @@
 
 import pytest
 from pathlib import Path
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
 from devdash.task_model import Task
 from devdash.task_export import (
     export_to_markdown,
+    export_to_markdown_to_file,
     export_tasks_to_file,
     get_export_filename,
 )
@@ -166,6 +167,13 @@ class TestExportFilename:
         assert "flat" in flat_name
         assert "grouped" in grouped_name
 
+    def test_filename_uses_given_time(self):
+        """Test a passed-in time is used for the filename and header."""
+        now = datetime(2025, 3, 4, 5, 6, 7)
+        assert get_export_filename("flat", now) == "devdash_tasks_flat_20250304_050607.md"
+        content = export_to_markdown([], format_type="flat", now=now)
+        assert "*Exported: 2025-03-04 05:06*" in content
+
 
 class TestExportTasksToFile:
     """Test high-level export to file function."""
@@ -194,6 +202,14 @@ class TestExportTasksToFile:
         assert "High priority task" in content
         assert "Total tasks: 5" in content
 
+    def test_streamed_file_matches_string_export(self, sample_tasks, tmp_path):
+        """Test the streamed file holds the string export plus a final newline."""
+        output_file = tmp_path / "streamed.md"
+        for format_type in ("flat", "grouped", "category"):
+            export_to_markdown_to_file(sample_tasks, output_file, format_type=format_type)
+            content = export_to_markdown(sample_tasks, format_type=format_type)
+            assert output_file.read_text(encoding="utf-8") == content + "\n"
+
 
 class TestExportFormatting:
     """Test specific formatting details."""
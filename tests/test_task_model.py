@@ -123,6 +123,33 @@ class TestTaskMethods:
         assert Task(id=1, text="Test", due_date=far).get_due_date_indicator() == "📆"
         assert Task(id=1, text="Test").get_due_date_indicator() == ""
 
+    def test_due_date_helpers_accept_reference_date(self):
+        """Test due date helpers evaluate against an explicit reference date."""
+        task = Task(id=1, text="Test", due_date="2025-06-10")
+
+        assert task.is_overdue(date(2025, 6, 11)) is True
+        assert task.is_due_soon(days=3, today=date(2025, 6, 8)) is True
+        assert task.get_due_date_indicator(date(2025, 6, 11)) == "⚠️"
+        assert task.get_due_date_indicator(date(2025, 6, 8)) == "📅"
+        assert task.get_due_date_indicator(date(2025, 5, 1)) == "📆"
+
+    def test_due_date_indicator_follows_edits(self):
+        """Test cached due date results are recomputed when the task changes."""
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        far = (date.today() + timedelta(days=10)).isoformat()
+
+        task = Task(id=1, text="Test", due_date=yesterday)
+        assert task.get_due_date_indicator() == "⚠️"
+
+        task.due_date = far
+        assert task.is_overdue() is False
+        assert task.get_due_date_indicator() == "📆"
+
+        task.due_date = yesterday
+        task.done = True
+        assert task.is_overdue() is False
+        assert task.get_due_date_indicator() == "📆"
+
 
 class TestTaskSerialization:
     """Test task serialization and deserialization."""
@@ -192,6 +219,17 @@ class TestMigration:
         assert all('priority' in task for task in new_tasks)
         assert all('categories' in task for task in new_tasks)
 
+    def test_migrate_task_list_shares_timestamp(self):
+        """Tasks missing created_at get one timestamp per batch; existing ones are kept."""
+        old_tasks = [
+            {"id": 1, "text": "Task 1", "done": False},
+            {"id": 2, "text": "Task 2", "done": False},
+            {"id": 3, "text": "Task 3", "done": False, "created_at": "2024-01-01T00:00:00"},
+        ]
+        new_tasks = migrate_task_list(old_tasks)
+        assert new_tasks[0]['created_at'] == new_tasks[1]['created_at']
+        assert new_tasks[2]['created_at'] == "2024-01-01T00:00:00"
+
     def test_validate_task_data(self):
         """Test task data validation."""
         valid = {"id": 1, "text": "Test", "done": False}
@@ -241,6 +279,20 @@ class TestSorting:
         assert sorted_tasks[1].text == "Banana"
         assert sorted_tasks[2].text == "Zebra"
 
+    def test_sort_in_place(self):
+        """Test in_place sorts the given list rather than a copy."""
+        tasks = [
+            Task(id=1, text="Zebra"),
+            Task(id=2, text="Apple"),
+        ]
+        copied = sort_tasks(tasks, sort_by="text")
+        assert copied is not tasks
+        assert tasks[0].text == "Zebra"
+
+        result = sort_tasks(tasks, sort_by="text", in_place=True)
+        assert result is tasks
+        assert [t.text for t in tasks] == ["Apple", "Zebra"]
+
 
 class TestFiltering:
     """Test task filtering."""